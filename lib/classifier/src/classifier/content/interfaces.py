@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -87,3 +87,7 @@ class ContentProvider(ABC):
 
     def get_all_attribute_names(self, category: str, element: str) -> List[str]:
         return [a.name for a in self.get_attributes(category, element)]
+
+    def get_all_element_names_by_category(self) -> Dict[str, List[str]]:
+        """Element names for every category, in category order."""
+        return {c: self.get_all_element_names(c) for c in self.get_all_category_names()}
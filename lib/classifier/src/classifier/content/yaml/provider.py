@@ -21,9 +21,11 @@ Usage:
     examples = provider.get_examples("stage1")
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -36,6 +38,9 @@ from ..interfaces import (
     Rule,
 )
 
+# libyaml's C loader parses several times faster than the pure-Python one
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _sanitize_folder_name(name: str) -> str:
     """Convert display name to folder name."""
@@ -51,11 +56,24 @@ def _sanitize_folder_name(name: str) -> str:
 
 
 def _load_yaml(filepath: Path) -> dict:
-    """Load YAML file, returning empty dict if not found."""
-    if not filepath.exists():
+    """
+    Load YAML file, returning empty dict if not found.
+
+    Parsed files are cached by path and modification time, so unchanged
+    files are only parsed once. The returned dict is shared - don't mutate it.
+    """
+    try:
+        mtime_ns = filepath.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
+    return _load_yaml_cached(str(filepath), mtime_ns)
+
+
+@lru_cache(maxsize=1024)
+def _load_yaml_cached(filepath: str, mtime_ns: int) -> dict:
+    """Parse a YAML file (cached on path and mtime by _load_yaml)."""
     with open(filepath, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f, Loader=_YAMLLoader) or {}
 
 
 def _is_placeholder(text: str) -> bool:
@@ -73,11 +91,18 @@ class YAMLContentProvider(ContentProvider):
     Content is loaded lazily and cached.
     """
 
-    def __init__(self, artifacts_dir: str | Path, verbose: bool = False):
+    def __init__(
+        self,
+        artifacts_dir: str | Path,
+        verbose: bool = False,
+        max_workers: Optional[int] = None,
+    ):
         """
         Args:
             artifacts_dir: Path to artifacts directory
             verbose: Print loading progress
+            max_workers: If set, scan category folders on a thread pool of
+                this size instead of one at a time.
         """
         self.artifacts_dir = Path(artifacts_dir)
         self.verbose = verbose
@@ -97,68 +122,96 @@ class YAMLContentProvider(ContentProvider):
         self._attribute_rules: Dict[str, List[Rule]] = {}
 
         # Load structure
-        self._load_structure()
+        self._load_structure(max_workers)
 
-    def _load_structure(self) -> None:
+    def _load_structure(self, max_workers: Optional[int] = None) -> None:
         """Load the folder structure and cache category/element/attribute names."""
         self._category_dirs: Dict[str, Path] = {}
         self._element_dirs: Dict[str, Dict[str, Path]] = {}
         self._attribute_files: Dict[str, Dict[str, Dict[str, Path]]] = {}
 
-        for cat_dir in self.artifacts_dir.iterdir():
-            if not cat_dir.is_dir() or cat_dir.name.startswith("_"):
+        cat_dirs = [
+            cat_dir
+            for cat_dir in self.artifacts_dir.iterdir()
+            if cat_dir.is_dir() and not cat_dir.name.startswith("_")
+        ]
+
+        # Category folders are independent; map() keeps them in directory order
+        if max_workers:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                scanned = list(executor.map(self._scan_category, cat_dirs))
+        else:
+            scanned = [self._scan_category(cat_dir) for cat_dir in cat_dirs]
+
+        for result in scanned:
+            if result is None:
                 continue
+            cat_name, cat_dir, elem_dirs, attr_files = result
+            self._category_dirs[cat_name] = cat_dir
+            self._element_dirs[cat_name] = elem_dirs
+            self._attribute_files[cat_name] = attr_files
 
-            cat_yaml = cat_dir / "_category.yaml"
-            if not cat_yaml.exists():
-                continue
+        if self.verbose:
+            print(f"Loaded structure: {len(self._category_dirs)} categories")
 
-            cat_data = _load_yaml(cat_yaml)
-            cat_name = cat_data.get("name", cat_dir.name)
+    @staticmethod
+    def _scan_category(
+        cat_dir: Path,
+    ) -> Optional[Tuple[str, Path, Dict[str, Path], Dict[str, Dict[str, Path]]]]:
+        """
+        Read one category folder's YAML files.
 
-            self._category_dirs[cat_name] = cat_dir
-            self._element_dirs[cat_name] = {}
-            self._attribute_files[cat_name] = {}
+        Returns (category name, folder, element folders, attribute files),
+        or None if the folder has no _category.yaml.
+        """
+        cat_yaml = cat_dir / "_category.yaml"
+        if not cat_yaml.exists():
+            return None
 
-            for elem_dir in cat_dir.iterdir():
-                if not elem_dir.is_dir() or elem_dir.name.startswith("_"):
-                    continue
+        cat_data = _load_yaml(cat_yaml)
+        cat_name = cat_data.get("name", cat_dir.name)
 
-                elem_yaml = elem_dir / "_element.yaml"
-                if not elem_yaml.exists():
-                    continue
+        elem_dirs: Dict[str, Path] = {}
+        attr_files: Dict[str, Dict[str, Path]] = {}
+
+        for elem_dir in cat_dir.iterdir():
+            if not elem_dir.is_dir() or elem_dir.name.startswith("_"):
+                continue
+
+            elem_yaml = elem_dir / "_element.yaml"
+            if not elem_yaml.exists():
+                continue
 
-                elem_data = _load_yaml(elem_yaml)
-                elem_name = elem_data.get("name", elem_dir.name)
+            elem_data = _load_yaml(elem_yaml)
+            elem_name = elem_data.get("name", elem_dir.name)
 
-                self._element_dirs[cat_name][elem_name] = elem_dir
-                self._attribute_files[cat_name][elem_name] = {}
+            elem_dirs[elem_name] = elem_dir
+            attr_files[elem_name] = {}
 
-                for attr_file in elem_dir.iterdir():
-                    if not attr_file.is_file() or attr_file.suffix != ".yaml":
-                        continue
-                    if attr_file.name.startswith("_"):
-                        continue
+            for attr_file in elem_dir.iterdir():
+                if not attr_file.is_file() or attr_file.suffix != ".yaml":
+                    continue
+                if attr_file.name.startswith("_"):
+                    continue
 
-                    attr_data = _load_yaml(attr_file)
-                    attr_name = attr_data.get("name", attr_file.stem)
-                    self._attribute_files[cat_name][elem_name][attr_name] = attr_file
+                attr_data = _load_yaml(attr_file)
+                attr_name = attr_data.get("name", attr_file.stem)
+                attr_files[elem_name][attr_name] = attr_file
 
-        if self.verbose:
-            print(f"Loaded structure: {len(self._category_dirs)} categories")
+        return cat_name, cat_dir, elem_dirs, attr_files
 
     def get_categories(self) -> List[CategoryContent]:
         """Get all category definitions."""
         if self._categories is not None:
             return self._categories
 
-        self._categories = []
+        categories = []
 
         for cat_name, cat_dir in self._category_dirs.items():
             cat_yaml = cat_dir / "_category.yaml"
             cat_data = _load_yaml(cat_yaml)
 
-            self._categories.append(
+            categories.append(
                 CategoryContent(
                     name=cat_name,
                     description=cat_data.get("description", ""),
@@ -168,7 +221,9 @@ class YAMLContentProvider(ContentProvider):
                 )
             )
 
-        return self._categories
+        # Publish the cache only once it is complete (safe for concurrent readers)
+        self._categories = categories
+        return categories
 
     def get_elements(self, category: str) -> List[ElementContent]:
         """Get elements for a category."""
@@ -16,6 +16,8 @@ Output Structure:
         └── ...
 """
 
+import compileall
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import re
@@ -56,13 +58,17 @@ class PromptExporter:
         self.content = content
         self.schema_factory = schema_factory
 
-    def export_prompts(self, output_dir: str | Path, verbose: bool = True) -> dict:
+    def export_prompts(
+        self, output_dir: str | Path, verbose: bool = True, precompile: bool = False
+    ) -> dict:
         """
         Export prompts as Python files.
 
         Args:
             output_dir: Output directory (will create prompts/ structure inside)
             verbose: Print progress
+            precompile: Also write __pycache__ bytecode for the exported files,
+                so loading them later skips compiling from source
 
         Returns:
             Dict with export stats
@@ -72,24 +78,27 @@ class PromptExporter:
         prompts_dir.mkdir(parents=True, exist_ok=True)
 
         files_created = []
+        # Rendered (path, content) pairs, written together at the end
+        writes = []
+        # Prompt files reported once the writes succeed
+        written_prompts = []
 
         # Create main __init__.py
-        self._write_file(prompts_dir / "__init__.py", self._generate_main_init())
+        writes.append((prompts_dir / "__init__.py", self._generate_main_init()))
         files_created.append(prompts_dir / "__init__.py")
 
         # Stage 1
         stage1_dir = prompts_dir / "stage1"
         stage1_dir.mkdir(exist_ok=True)
 
-        self._write_file(stage1_dir / "__init__.py", self._generate_stage1_init())
+        writes.append((stage1_dir / "__init__.py", self._generate_stage1_init()))
         files_created.append(stage1_dir / "__init__.py")
 
         stage1_content = self._generate_stage1_prompt_file()
-        self._write_file(stage1_dir / "category_detection.py", stage1_content)
+        writes.append((stage1_dir / "category_detection.py", stage1_content))
         files_created.append(stage1_dir / "category_detection.py")
 
-        if verbose:
-            print("✓ stage1/category_detection.py")
+        written_prompts.append("stage1/category_detection.py")
 
         # Stage 2
         stage2_dir = prompts_dir / "stage2"
@@ -101,14 +110,13 @@ class PromptExporter:
         for cat in categories:
             cat_filename = _sanitize_name(cat.name)
             stage2_content = self._generate_stage2_prompt_file(cat.name)
-            self._write_file(stage2_dir / f"{cat_filename}.py", stage2_content)
+            writes.append((stage2_dir / f"{cat_filename}.py", stage2_content))
             files_created.append(stage2_dir / f"{cat_filename}.py")
             stage2_imports.append((cat_filename, cat.name))
 
-            if verbose:
-                print(f"✓ stage2/{cat_filename}.py")
+            written_prompts.append(f"stage2/{cat_filename}.py")
 
-        self._write_file(stage2_dir / "__init__.py", self._generate_stage2_init(stage2_imports))
+        writes.append((stage2_dir / "__init__.py", self._generate_stage2_init(stage2_imports)))
         files_created.append(stage2_dir / "__init__.py")
 
         # Stage 3 (optional - per element)
@@ -127,19 +135,27 @@ class PromptExporter:
             for elem in elements:
                 elem_filename = _sanitize_name(elem.name)
                 stage3_content = self._generate_stage3_prompt_file(cat.name, elem.name)
-                self._write_file(cat_dir / f"{elem_filename}.py", stage3_content)
+                writes.append((cat_dir / f"{elem_filename}.py", stage3_content))
                 files_created.append(cat_dir / f"{elem_filename}.py")
                 elem_imports.append((elem_filename, elem.name))
 
-                if verbose:
-                    print(f"✓ stage3/{cat_filename}/{elem_filename}.py")
+                written_prompts.append(f"stage3/{cat_filename}/{elem_filename}.py")
 
-            self._write_file(
-                cat_dir / "__init__.py", self._generate_stage3_category_init(elem_imports)
+            writes.append(
+                (cat_dir / "__init__.py", self._generate_stage3_category_init(elem_imports))
             )
             stage3_imports.append((cat_filename, cat.name))
 
-        self._write_file(stage3_dir / "__init__.py", self._generate_stage3_init(stage3_imports))
+        writes.append((stage3_dir / "__init__.py", self._generate_stage3_init(stage3_imports)))
+
+        self._write_files(writes)
+
+        if verbose:
+            for name in written_prompts:
+                print(f"✓ {name}")
+
+        if precompile:
+            compileall.compile_dir(prompts_dir, quiet=1)
 
         if verbose:
             print(f"\n✓ Exported {len(files_created)} files to {prompts_dir}")
@@ -153,6 +169,12 @@ class PromptExporter:
         """Write content to file."""
         path.write_text(content, encoding="utf-8")
 
+    def _write_files(self, writes: list) -> None:
+        """Write (path, content) pairs concurrently so the file I/O overlaps."""
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            # list() surfaces the first write error, if any
+            list(executor.map(lambda item: self._write_file(*item), writes))
+
     def _generate_main_init(self) -> str:
         """Generate main prompts/__init__.py."""
         return f'''"""
@@ -8,13 +8,59 @@ Provides LLM clients for different backends:
 The LLMClient interface ensures all clients work the same way.
 """
 
+import hashlib
 import json
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from pydantic import BaseModel
 
 from .interfaces import LLMClient, LLMResponse
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; prompts are scanned key by key instead
+    ahocorasick = None
+
+
+class _ResponseDict(dict):
+    """Dict of mock responses that flags key changes, so the matcher is rebuilt lazily."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dirty = True
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.dirty = True
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.dirty = True
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.dirty = True
+
+    def setdefault(self, key, default=None):
+        self.dirty = True
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self.dirty = True
+        return super().pop(*args)
+
+    def popitem(self):
+        self.dirty = True
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self.dirty = True
+
 
 class MockLLMClient(LLMClient):
     """
@@ -31,21 +77,59 @@ class MockLLMClient(LLMClient):
         llm = MockLLMClient(responses={
             "prompt1": {"categories_present": ["People"]},
         })
+
+        # Validate schema-generated responses once per schema (faster bulk runs)
+        llm = MockLLMClient(fast_mode=True)
+
+        # Memoize responses per (prompt, schema) for repeated prompts
+        llm = MockLLMClient(cache_size=1024)
+
+    With cache_size set, repeated prompts return the same LLMResponse without
+    re-validating (calls are still recorded). The memo does not track edits
+    to responses or default_response; call clear_cache() after changing them.
     """
 
     def __init__(
         self,
         responses: Optional[Dict[str, Any]] = None,
         default_response: Optional[Dict[str, Any]] = None,
+        fast_mode: bool = False,
+        cache_size: int = 0,
     ):
         """
         Args:
-            responses: Dict mapping prompt substrings to responses
+            responses: Dict mapping prompt substrings to responses. It is
+                copied; edit client.responses (or assign a new dict) to change
+                responses later, and the matcher is rebuilt on the next call.
             default_response: Response to use when no match found
+            fast_mode: Validate the schema-generated mock response once per
+                schema and reuse it for every prompt without a predefined
+                response. Predefined responses are always validated.
+            cache_size: Max responses memoized per (prompt, schema); 0 (the
+                default) disables memoization.
         """
         self.responses = responses or {}
         self.default_response = default_response
+        self.fast_mode = fast_mode
         self.call_history: List[Dict[str, Any]] = []
+        self._matcher = None
+        self.cache_size = cache_size
+        self._response_cache: Dict[Tuple[bytes, Type[BaseModel]], LLMResponse] = {}
+        self._schema_responses: Dict[Type[BaseModel], LLMResponse] = {}
+
+    @property
+    def responses(self) -> Dict[str, Any]:
+        """Predefined responses keyed by prompt substring."""
+        return self._responses
+
+    @responses.setter
+    def responses(self, responses: Dict[str, Any]) -> None:
+        self._responses = _ResponseDict(responses)
+
+    def clear_cache(self) -> None:
+        """Drop memoized responses (e.g. after editing responses)."""
+        self._response_cache.clear()
+        self._schema_responses.clear()
 
     def generate(
         self,
@@ -63,13 +147,46 @@ class MockLLMClient(LLMClient):
             }
         )
 
+        if not self.cache_size:
+            return self._respond(prompt, schema)
+
+        # Key on a fixed-size digest so long prompts aren't kept alive
+        key = (hashlib.blake2b(prompt.encode(), digest_size=16).digest(), schema)
+        response = self._response_cache.get(key)
+        if response is None:
+            response = self._respond(prompt, schema)
+            if len(self._response_cache) >= self.cache_size:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._response_cache[next(iter(self._response_cache))]
+            self._response_cache[key] = response
+        return response
+
+    def _respond(self, prompt: str, schema: Type[BaseModel]) -> LLMResponse:
+        """Build the response for a prompt (uncached)."""
         # Find matching response
         response_data = self._find_response(prompt)
 
         if response_data is None:
+            if self.fast_mode:
+                # Generated data depends only on the schema, so it is validated
+                # (enums, nested models) once and the response shared
+                response = self._schema_responses.get(schema)
+                if response is None:
+                    response = self._respond_with_data(
+                        self._generate_mock_from_schema(schema), schema
+                    )
+                    self._schema_responses[schema] = response
+                return response
+
             # Generate mock data from schema
             response_data = self._generate_mock_from_schema(schema)
 
+        return self._respond_with_data(response_data, schema)
+
+    def _respond_with_data(
+        self, response_data: Dict[str, Any], schema: Type[BaseModel]
+    ) -> LLMResponse:
+        """Validate response data into the schema."""
         # Parse into schema
         try:
             parsed = schema.model_validate(response_data)
@@ -94,8 +211,42 @@ class MockLLMClient(LLMClient):
             for prompt, schema in zip(prompts, schemas)
         ]
 
+    @staticmethod
+    def _build_matcher(keys: Tuple[str, ...]):
+        """
+        Compile the response keys into an Aho-Corasick automaton.
+
+        Returns None (plain substring scan) when pyahocorasick is not
+        installed or a key can't be indexed.
+        """
+        if ahocorasick is None or not keys:
+            return None
+        if not all(isinstance(key, str) and key for key in keys):
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for index, key in enumerate(keys):
+            automaton.add_word(key, (index, key))
+        automaton.make_automaton()
+        return automaton
+
     def _find_response(self, prompt: str) -> Optional[Dict]:
         """Find a predefined response matching the prompt."""
+        if self._responses.dirty:
+            # responses was edited or replaced since the last call
+            self._matcher = self._build_matcher(tuple(self._responses))
+            self._responses.dirty = False
+
+        if self._matcher is not None:
+            # One pass over the prompt; the earliest-added matching key wins,
+            # as with the key-by-key scan. Values are read from responses.
+            first = min(
+                (match for _, match in self._matcher.iter(prompt)),
+                key=lambda match: match[0],
+                default=None,
+            )
+            return self.responses[first[1]] if first is not None else self.default_response
+
         for key, response in self.responses.items():
             if key in prompt:
                 return response
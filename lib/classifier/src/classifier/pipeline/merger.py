@@ -10,7 +10,7 @@ Usage:
     final_results = merger.merge(context)
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from ..pipeline.interfaces import PipelineContext
 from ..schemas.base import (
@@ -34,6 +34,20 @@ class ResultMerger:
     Produces FinalClassificationOutput for each text.
     """
 
+    # Every key a flat record can have, in export column order
+    FLAT_RECORD_FIELDS = (
+        "text",
+        "category",
+        "element",
+        "element_sentiment",
+        "element_confidence",
+        "element_excerpt",
+        "attribute",
+        "attribute_sentiment",
+        "attribute_confidence",
+        "attribute_excerpt",
+    )
+
     def merge(self, context: PipelineContext) -> Dict[str, FinalClassificationOutput]:
         """
         Merge all stage results into final outputs.
@@ -142,58 +156,60 @@ class ResultMerger:
 
         Each row = one attribute (or element if no attributes).
         """
-        records = []
+        return list(self.iter_flat_records(results))
+
+    def iter_flat_records(
+        self, results: Dict[str, FinalClassificationOutput]
+    ) -> Iterator[Dict]:
+        """
+        Yield flat records one at a time (see to_flat_records).
 
+        Lets exporters stream records to disk without holding them all.
+        Records only contain the keys relevant to their level; the full
+        column set is FLAT_RECORD_FIELDS.
+        """
         for text, output in results.items():
             for cat in output.categories:
                 if not cat.elements:
-                    records.append(
-                        {
+                    yield {
+                        "text": text,
+                        "category": cat.name,
+                        "element": None,
+                        "element_sentiment": None,
+                        "attribute": None,
+                        "attribute_sentiment": None,
+                    }
+                    continue
+
+                for elem in cat.elements:
+                    if not elem.attributes:
+                        yield {
                             "text": text,
                             "category": cat.name,
-                            "element": None,
-                            "element_sentiment": None,
+                            "element": elem.name,
+                            "element_sentiment": elem.sentiment.value
+                            if elem.sentiment
+                            else None,
+                            "element_confidence": elem.confidence,
+                            "element_excerpt": elem.excerpt,
                             "attribute": None,
                             "attribute_sentiment": None,
                         }
-                    )
-                    continue
-
-                for elem in cat.elements:
-                    if not elem.attributes:
-                        records.append(
-                            {
-                                "text": text,
-                                "category": cat.name,
-                                "element": elem.name,
-                                "element_sentiment": elem.sentiment.value
-                                if elem.sentiment
-                                else None,
-                                "element_confidence": elem.confidence,
-                                "element_excerpt": elem.excerpt,
-                                "attribute": None,
-                                "attribute_sentiment": None,
-                            }
-                        )
                         continue
 
                     for attr in elem.attributes:
-                        records.append(
-                            {
-                                "text": text,
-                                "category": cat.name,
-                                "element": elem.name,
-                                "element_sentiment": elem.sentiment.value
-                                if elem.sentiment
-                                else None,
-                                "element_confidence": elem.confidence,
-                                "attribute": attr.name,
-                                "attribute_sentiment": attr.sentiment.value
-                                if attr.sentiment
-                                else None,
-                                "attribute_confidence": attr.confidence,
-                                "attribute_excerpt": attr.excerpt,
-                            }
-                        )
-
-        return records
+                        yield {
+                            "text": text,
+                            "category": cat.name,
+                            "element": elem.name,
+                            "element_sentiment": elem.sentiment.value
+                            if elem.sentiment
+                            else None,
+                            "element_confidence": elem.confidence,
+                            "attribute": attr.name,
+                            "attribute_sentiment": attr.sentiment.value
+                            if attr.sentiment
+                            else None,
+                            "attribute_confidence": attr.confidence,
+                            "attribute_excerpt": attr.excerpt,
+                        }
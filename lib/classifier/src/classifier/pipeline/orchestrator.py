@@ -69,6 +69,9 @@ class PipelineOrchestrator:
         # Resolve execution order
         execution_order = self.registry.resolve_order(stages)
 
+        # Results are keyed by text, so repeated texts only need one LLM call
+        texts = list(dict.fromkeys(texts))
+
         if self.verbose:
             self._log(f"Pipeline: {' → '.join(execution_order)}")
             self._log(f"Processing {len(texts)} texts")
@@ -121,6 +124,9 @@ class PipelineOrchestrator:
         """
         execution_order = self.registry.resolve_order(stages)
 
+        # Results are keyed by text, so repeated texts only need one LLM call
+        texts = list(dict.fromkeys(texts))
+
         context = PipelineContext()
         context.set_metadata("start_time", datetime.now().isoformat())
 
@@ -11,6 +11,7 @@ Static Schemas (base.py):
 Dynamic Schema Factory (factory.py):
     - TaxonomySchemaFactory - builds schemas with Literal constraints
     - Utilities for schema inspection
+    - clear_schema_cache() - drop memoized schema models
 
 Usage:
     from refactored_classifier.schemas import TaxonomySchemaFactory, SentimentType
@@ -35,6 +36,7 @@ from .base import (
 )
 from .factory import (
     TaxonomySchemaFactory,
+    clear_schema_cache,
     get_valid_values,
     schema_to_json_example,
 )
@@ -58,6 +60,7 @@ __all__ = [
     "FinalClassificationOutput",
     # Factory
     "TaxonomySchemaFactory",
+    "clear_schema_cache",
     "get_valid_values",
     "schema_to_json_example",
 ]
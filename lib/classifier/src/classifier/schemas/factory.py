@@ -20,9 +20,11 @@ Usage:
     Stage2Schema = factory.get_stage2_schema(category="People")
 """
 
-from typing import Any, Dict, List, Literal, Optional, Type, get_args
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple, Type, get_args
 
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, ConfigDict, Field, create_model
 
 from ..content.interfaces import ContentProvider
 from .base import SentimentType
@@ -67,16 +69,7 @@ class TaxonomySchemaFactory(SchemaFactory):
         if not category_names:
             raise ValueError("No categories found in content provider")
 
-        # Create Literal type for categories
-        CategoryLiteral = Literal[tuple(category_names)]  # type: ignore
-
-        # Build the schema dynamically
-        self._stage1_schema = create_model(
-            "Stage1Output",
-            categories_present=(List[CategoryLiteral], ...),  # type: ignore
-            reasoning=(str, Field(default="")),
-        )
-
+        self._stage1_schema = _build_stage1_schema(tuple(category_names))
         return self._stage1_schema
 
     def get_stage2_schema(self, category: str) -> Type[BaseModel]:
@@ -103,26 +96,7 @@ class TaxonomySchemaFactory(SchemaFactory):
         if not element_names:
             raise ValueError(f"No elements found for category: {category}")
 
-        # Create Literal type for elements
-        ElementLiteral = Literal[tuple(element_names)]  # type: ignore
-
-        # Create the element detection model
-        ElementDetection = create_model(
-            f"ElementDetection_{_safe_name(category)}",
-            element=(ElementLiteral, ...),  # type: ignore
-            sentiment=(SentimentType, ...),
-            confidence=(int, Field(ge=1, le=5)),
-            excerpt=(str, Field(default="")),
-            reasoning=(str, Field(default="")),
-        )
-
-        # Create the stage output model
-        schema = create_model(
-            f"Stage2Output_{_safe_name(category)}",
-            category=(Literal[category], category),  # type: ignore
-            elements=(List[ElementDetection], ...),
-        )
-
+        schema = _build_stage2_schema(category, tuple(element_names))
         self._stage2_schemas[category] = schema
         return schema
 
@@ -139,41 +113,7 @@ class TaxonomySchemaFactory(SchemaFactory):
         # Get valid attribute names
         attribute_names = self.content.get_all_attribute_names(category, element)
 
-        if not attribute_names:
-            # If no attributes, return a simple schema
-            schema = create_model(
-                f"Stage3Output_{_safe_name(category)}_{_safe_name(element)}",
-                category=(Literal[category], category),  # type: ignore
-                element=(Literal[element], element),  # type: ignore
-                element_sentiment=(SentimentType, ...),
-                attributes=(List[Any], Field(default_factory=list)),
-            )
-            self._stage3_schemas[cache_key] = schema
-            return schema
-
-        # Create Literal type for attributes
-        AttributeLiteral = Literal[tuple(attribute_names)]  # type: ignore
-
-        # Create attribute detection model
-        AttributeDetection = create_model(
-            f"AttributeDetection_{_safe_name(category)}_{_safe_name(element)}",
-            attribute=(AttributeLiteral, ...),  # type: ignore
-            sentiment=(SentimentType, ...),
-            confidence=(int, Field(ge=1, le=5)),
-            excerpt=(str, Field(default="")),
-            reasoning=(str, Field(default="")),
-        )
-
-        # Create stage output model
-        schema = create_model(
-            f"Stage3Output_{_safe_name(category)}_{_safe_name(element)}",
-            category=(Literal[category], category),  # type: ignore
-            element=(Literal[element], element),  # type: ignore
-            element_sentiment=(SentimentType, ...),
-            attributes=(List[AttributeDetection], ...),
-            sentiment_consensus=(bool, True),
-        )
-
+        schema = _build_stage3_schema(category, element, tuple(attribute_names))
         self._stage3_schemas[cache_key] = schema
         return schema
 
@@ -183,20 +123,180 @@ class TaxonomySchemaFactory(SchemaFactory):
         self._stage2_schemas.clear()
         self._stage3_schemas.clear()
 
-    def get_all_stage2_schemas(self) -> Dict[str, Type[BaseModel]]:
-        """Get Stage 2 schemas for all categories."""
+    def get_all_stage2_schemas(
+        self, max_workers: Optional[int] = None
+    ) -> Dict[str, Type[BaseModel]]:
+        """
+        Get Stage 2 schemas for all categories.
+
+        Args:
+            max_workers: If set, build uncached schemas on a thread pool of
+                this size instead of one at a time.
+        """
+        if not max_workers:
+            for category in self.content.get_all_category_names():
+                self.get_stage2_schema(category)
+            return self._stage2_schemas
+
+        # Resolve names up front so the pool only runs the builders
+        jobs = []
         for category in self.content.get_all_category_names():
-            self.get_stage2_schema(category)
+            if category in self._stage2_schemas:
+                continue
+            element_names = self.content.get_all_element_names(category)
+            if not element_names:
+                raise ValueError(f"No elements found for category: {category}")
+            jobs.append((category, tuple(element_names)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            schemas = executor.map(lambda job: _build_stage2_schema(*job), jobs)
+            for (category, _), schema in zip(jobs, schemas):
+                self._stage2_schemas[category] = schema
         return self._stage2_schemas
 
-    def get_all_stage3_schemas(self) -> Dict[str, Type[BaseModel]]:
-        """Get Stage 3 schemas for all category/element pairs."""
-        for category in self.content.get_all_category_names():
-            for element in self.content.get_all_element_names(category):
-                self.get_stage3_schema(category, element)
+    def get_all_stage3_schemas(
+        self, max_workers: Optional[int] = None
+    ) -> Dict[str, Type[BaseModel]]:
+        """
+        Get Stage 3 schemas for all category/element pairs.
+
+        Args:
+            max_workers: If set, build uncached schemas on a thread pool of
+                this size instead of one at a time.
+        """
+        elements_by_category = self.content.get_all_element_names_by_category()
+
+        if not max_workers:
+            for category, elements in elements_by_category.items():
+                for element in elements:
+                    self.get_stage3_schema(category, element)
+            return self._stage3_schemas
+
+        # Resolve names up front so the pool only runs the builders
+        jobs = []
+        for category, elements in elements_by_category.items():
+            for element in elements:
+                if f"{category}:{element}" in self._stage3_schemas:
+                    continue
+                attribute_names = self.content.get_all_attribute_names(category, element)
+                jobs.append((category, element, tuple(attribute_names)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            schemas = executor.map(lambda job: _build_stage3_schema(*job), jobs)
+            for (category, element, _), schema in zip(jobs, schemas):
+                self._stage3_schemas[f"{category}:{element}"] = schema
         return self._stage3_schemas
 
 
+# =============================================================================
+# Schema Builders
+# =============================================================================
+# A schema depends only on the taxonomy names it constrains, so the builders
+# are memoized on those names. Factories over the same taxonomy (e.g. a new
+# factory per pipeline run) reuse the generated models instead of rebuilding
+# them with create_model(). The caches are bounded so long-lived processes
+# that reload edited taxonomies don't keep every old model; clear_schema_cache()
+# drops them all.
+#
+# Models are created with defer_build: pydantic compiles a model's validator
+# on first use instead of at class creation, so schemas for elements that are
+# never detected in a run are never compiled.
+
+_SCHEMA_CONFIG = ConfigDict(defer_build=True)
+
+# Max models kept per stage builder (Stage 2/3 hold one per category/element)
+_SCHEMA_CACHE_SIZE = 1024
+
+
+def clear_schema_cache() -> None:
+    """Drop the memoized schema models shared by all TaxonomySchemaFactory instances."""
+    _build_stage1_schema.cache_clear()
+    _build_stage2_schema.cache_clear()
+    _build_stage3_schema.cache_clear()
+
+
+@lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
+def _build_stage1_schema(category_names: Tuple[str, ...]) -> Type[BaseModel]:
+    """Build the Stage 1 output model for the given category names."""
+    # Create Literal type for categories
+    CategoryLiteral = Literal[category_names]  # type: ignore
+
+    return create_model(
+        "Stage1Output",
+        __config__=_SCHEMA_CONFIG,
+        categories_present=(List[CategoryLiteral], ...),  # type: ignore
+        reasoning=(str, Field(default="")),
+    )
+
+
+@lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
+def _build_stage2_schema(category: str, element_names: Tuple[str, ...]) -> Type[BaseModel]:
+    """Build the Stage 2 output model for one category's element names."""
+    # Create Literal type for elements
+    ElementLiteral = Literal[element_names]  # type: ignore
+
+    # Create the element detection model
+    ElementDetection = create_model(
+        f"ElementDetection_{_safe_name(category)}",
+        __config__=_SCHEMA_CONFIG,
+        element=(ElementLiteral, ...),  # type: ignore
+        sentiment=(SentimentType, ...),
+        confidence=(int, Field(ge=1, le=5)),
+        excerpt=(str, Field(default="")),
+        reasoning=(str, Field(default="")),
+    )
+
+    # Create the stage output model
+    return create_model(
+        f"Stage2Output_{_safe_name(category)}",
+        __config__=_SCHEMA_CONFIG,
+        category=(Literal[category], category),  # type: ignore
+        elements=(List[ElementDetection], ...),
+    )
+
+
+@lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
+def _build_stage3_schema(
+    category: str, element: str, attribute_names: Tuple[str, ...]
+) -> Type[BaseModel]:
+    """Build the Stage 3 output model for one element's attribute names."""
+    if not attribute_names:
+        # If no attributes, return a simple schema
+        return create_model(
+            f"Stage3Output_{_safe_name(category)}_{_safe_name(element)}",
+            __config__=_SCHEMA_CONFIG,
+            category=(Literal[category], category),  # type: ignore
+            element=(Literal[element], element),  # type: ignore
+            element_sentiment=(SentimentType, ...),
+            attributes=(List[Any], Field(default_factory=list)),
+        )
+
+    # Create Literal type for attributes
+    AttributeLiteral = Literal[attribute_names]  # type: ignore
+
+    # Create attribute detection model
+    AttributeDetection = create_model(
+        f"AttributeDetection_{_safe_name(category)}_{_safe_name(element)}",
+        __config__=_SCHEMA_CONFIG,
+        attribute=(AttributeLiteral, ...),  # type: ignore
+        sentiment=(SentimentType, ...),
+        confidence=(int, Field(ge=1, le=5)),
+        excerpt=(str, Field(default="")),
+        reasoning=(str, Field(default="")),
+    )
+
+    # Create stage output model
+    return create_model(
+        f"Stage3Output_{_safe_name(category)}_{_safe_name(element)}",
+        __config__=_SCHEMA_CONFIG,
+        category=(Literal[category], category),  # type: ignore
+        element=(Literal[element], element),  # type: ignore
+        element_sentiment=(SentimentType, ...),
+        attributes=(List[AttributeDetection], ...),
+        sentiment_consensus=(bool, True),
+    )
+
+
 def _safe_name(name: str) -> str:
     """Convert a name to a valid Python identifier."""
     # Replace special characters with underscores
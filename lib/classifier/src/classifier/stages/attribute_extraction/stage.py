@@ -21,7 +21,7 @@ To Modify:
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from pydantic import BaseModel
 
@@ -96,18 +96,21 @@ class AttributeExtractionStage(BaseStage):
         if not tasks:
             return {text: {} for text in texts}
 
-        # 2. Build prompts and get schemas
+        # 2. Build prompts and get schemas (one prompt template per element/sentiment)
+        builders: Dict[Tuple[str, str, Any], Callable[[str], str]] = {}
         prompts = []
         schemas = []
         for task in tasks:
-            prompt = self.build_prompt(
-                text=task.text,
-                context=context,
-                category=task.category,
-                element=task.element,
-                element_sentiment=task.element_sentiment,
-            )
-            prompts.append(prompt)
+            key = (task.category, task.element, task.element_sentiment)
+            build = builders.get(key)
+            if build is None:
+                build = builders[key] = self.prompt_builder(
+                    context=context,
+                    category=task.category,
+                    element=task.element,
+                    element_sentiment=task.element_sentiment,
+                )
+            prompts.append(build(task.text))
             schemas.append(self.schema_factory.get_stage3_schema(task.category, task.element))
 
         # 3. Batch LLM call
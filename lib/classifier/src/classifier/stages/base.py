@@ -10,7 +10,7 @@ Individual stages extend this base and implement their specific logic.
 """
 
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Type
 
 from pydantic import BaseModel
 
@@ -19,6 +19,9 @@ from ..infrastructure.llm.interfaces import LLMClient
 from ..pipeline.interfaces import PipelineContext, Stage
 from ..schemas.interfaces import SchemaFactory
 
+# Stand-in text used to render a prompt template once per batch
+_TEXT_PLACEHOLDER = "\x00__TEXT__\x00"
+
 
 class BaseStage(Stage):
     """
@@ -93,6 +96,22 @@ class BaseStage(Stage):
         """Get prompt for export (implements Stage interface)."""
         return self.build_prompt(text, context)
 
+    def prompt_builder(self, **kwargs) -> Callable[[str], str]:
+        """
+        Return a text -> prompt function for prompts sharing the same kwargs.
+
+        The prompt is rendered once with a placeholder text and split around
+        it, so the definitions/examples/rules preamble is formatted once per
+        batch instead of once per text. Falls back to calling build_prompt()
+        per text if the placeholder doesn't appear exactly once.
+        """
+        template = self.build_prompt(_TEXT_PLACEHOLDER, **kwargs)
+        head, found, tail = template.partition(_TEXT_PLACEHOLDER)
+
+        if not found or _TEXT_PLACEHOLDER in tail:
+            return lambda text: self.build_prompt(text, **kwargs)
+        return lambda text: head + text + tail
+
     # =========================================================================
     # Utility Methods
     # =========================================================================
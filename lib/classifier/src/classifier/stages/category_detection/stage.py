@@ -62,8 +62,9 @@ class CategoryDetectionStage(BaseStage):
         # Get the schema (with Literal-constrained category names)
         schema = self.schema_factory.get_stage1_schema()
 
-        # Build prompts for all texts
-        prompts = [self.build_prompt(text) for text in texts]
+        # Build prompts for all texts (the shared preamble is rendered once)
+        build = self.prompt_builder()
+        prompts = [build(text) for text in texts]
         schemas = [schema] * len(texts)
 
         # Batch LLM call
@@ -17,7 +17,7 @@ To Modify:
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from pydantic import BaseModel
 
@@ -90,16 +90,17 @@ class ElementExtractionStage(BaseStage):
             # No categories detected, return empty results
             return {text: {} for text in texts}
 
-        # 2. Build prompts and get schemas
+        # 2. Build prompts and get schemas (one prompt template per category)
+        builders: Dict[str, Callable[[str], str]] = {}
         prompts = []
         schemas = []
         for task in tasks:
-            prompt = self.build_prompt(
-                text=task.text,
-                context=context,
-                category=task.category,
-            )
-            prompts.append(prompt)
+            build = builders.get(task.category)
+            if build is None:
+                build = builders[task.category] = self.prompt_builder(
+                    context=context, category=task.category
+                )
+            prompts.append(build(task.text))
             schemas.append(self.schema_factory.get_stage2_schema(task.category))
 
         # 3. Batch LLM call
@@ -7,13 +7,15 @@ including Excel, CSV, JSON, and more.
 
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import pandas as pd
 
 
 def read_tabular_file(
-    filepath: str | Path, sheet_name: str | int | None = None
+    filepath: str | Path,
+    sheet_name: str | int | None = None,
+    usecols: list[str] | Callable[[Any], bool] | None = None,
 ) -> pd.DataFrame:
     """
     Read tabular data from Excel, CSV, or JSON file.
@@ -22,6 +24,10 @@ def read_tabular_file(
         filepath: Path to the input file
         sheet_name: For Excel files, the sheet name or index (0-based).
                     If None, reads the first sheet. Ignored for CSV/JSON.
+        usecols: Optional column subset, either a list of column names or a
+                 predicate called with each column name. Excel and CSV readers
+                 skip the other columns while parsing; JSON is filtered after
+                 loading.
 
     Returns:
         pandas DataFrame
@@ -38,11 +44,17 @@ def read_tabular_file(
     suffix = filepath.suffix.lower()
 
     if suffix in [".xlsx", ".xls"]:
-        return pd.read_excel(filepath, sheet_name=sheet_name)
+        return pd.read_excel(
+            filepath, sheet_name=0 if sheet_name is None else sheet_name, usecols=usecols
+        )
     elif suffix == ".csv":
-        return pd.read_csv(filepath)
+        return pd.read_csv(filepath, usecols=usecols)
     elif suffix == ".json":
-        return pd.read_json(filepath)
+        df = pd.read_json(filepath)
+        if usecols is None:
+            return df
+        keep = usecols if callable(usecols) else set(usecols).__contains__
+        return df[[col for col in df.columns if keep(col)]]
     else:
         raise ValueError(f"Unsupported file format: {suffix}. Use .xlsx, .xls, .csv, or .json")
 
@@ -8,23 +8,60 @@ Hierarchy: Root → Group → Topic → Attribute
 """
 
 import ast
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 import json
-import math
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from .data_io import read_tabular_file, save_json
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to stdlib json via save_json
+    orjson = None
+
+# Sections of a comprehensive definition, in output order
+_DEFINITION_SECTIONS = (
+    "%(description)s",
+    "**Definition:** %(definition)s",
+    "**Includes:** %(inclusions)s",
+    "**Excludes:** %(exclusions)s",
+    "**Decision Rule:** %(decision_rule)s",
+)
+
+# One template per combination of non-empty sections, indexed by bitmask
+_DEFINITION_TEMPLATES = tuple(
+    "\n\n".join(
+        ["**%(name)s**"]
+        + [section for bit, section in enumerate(_DEFINITION_SECTIONS) if mask >> bit & 1]
+    )
+    for mask in range(1 << len(_DEFINITION_SECTIONS))
+)
+
 
-@dataclass
 class BuilderLog:
     """Container for warnings and errors during hierarchy building."""
 
-    warnings: list[str] = field(default_factory=list)
-    errors: list[str] = field(default_factory=list)
+    __slots__ = ("warnings", "errors", "max_warnings", "suppressed_warnings", "_warn_seen")
+
+    def __init__(self, max_warnings: int = 10000):
+        self.warnings: list[str] = []
+        self.errors: list[str] = []
+        self.max_warnings = max_warnings
+        self.suppressed_warnings = 0
+        # Messages of the kept warnings, in the same order as self.warnings
+        self._warn_seen: dict[str, None] = {}
 
     def warn(self, message: str, row_idx: int | None = None):
+        # A message repeated on another row, or anything past the cap, is
+        # only counted; the first row it appeared on is kept
+        if message in self._warn_seen or len(self.warnings) >= self.max_warnings:
+            self.suppressed_warnings += 1
+            return
+        self._warn_seen[message] = None
+
         prefix = f"[Row {row_idx}] " if row_idx is not None else ""
         self.warnings.append(f"{prefix}{message}")
 
@@ -32,6 +69,17 @@ class BuilderLog:
         prefix = f"[Row {row_idx}] " if row_idx is not None else ""
         self.errors.append(f"{prefix}{message}")
 
+    def merge(self, other: "BuilderLog"):
+        """Append another log's messages, keeping this log's dedup and warning cap."""
+        for message, warning in zip(other._warn_seen, other.warnings):
+            if message in self._warn_seen or len(self.warnings) >= self.max_warnings:
+                self.suppressed_warnings += 1
+                continue
+            self._warn_seen[message] = None
+            self.warnings.append(warning)
+        self.suppressed_warnings += other.suppressed_warnings
+        self.errors.extend(other.errors)
+
     def has_issues(self) -> bool:
         return bool(self.warnings or self.errors)
 
@@ -45,6 +93,8 @@ class BuilderLog:
             lines.append(f"WARNINGS ({len(self.warnings)}):")
             for warn in self.warnings:
                 lines.append(f"  ⚠ {warn}")
+            if self.suppressed_warnings:
+                lines.append(f"  (+{self.suppressed_warnings} more suppressed)")
         if not lines:
             lines.append("No issues found.")
         return "\n".join(lines)
@@ -54,6 +104,55 @@ class BuilderLog:
         print(self.summary())
 
 
+@dataclass(slots=True)
+class HierarchyNode:
+    """A node of the hierarchy; field order matches the serialized JSON keys."""
+
+    name: str
+    keywords: list[str] = field(default_factory=list)
+    definition: str = ""
+    description: str = ""
+    scope: str = ""
+    inclusions: str = ""
+    exclusions: str = ""
+    decision_rule: str = ""
+    comprehensive_definition: str = ""
+    children: list["HierarchyNode"] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert this node and its subtree to plain dictionaries.
+
+        Walks the tree with an explicit stack rather than recursion, so the
+        depth of the taxonomy is not bounded by the interpreter's recursion
+        limit.
+        """
+        result: list[dict[str, Any]] = []
+        stack: deque[tuple[HierarchyNode, list[dict[str, Any]]]] = deque([(self, result)])
+
+        while stack:
+            node, siblings = stack.pop()
+            children: list[dict[str, Any]] = []
+            siblings.append(
+                {
+                    "name": node.name,
+                    "keywords": node.keywords,
+                    "definition": node.definition,
+                    "description": node.description,
+                    "scope": node.scope,
+                    "inclusions": node.inclusions,
+                    "exclusions": node.exclusions,
+                    "decision_rule": node.decision_rule,
+                    "comprehensive_definition": node.comprehensive_definition,
+                    "children": children,
+                }
+            )
+            # Reversed so children pop off the stack in their original order
+            stack.extend((child, children) for child in reversed(node.children))
+
+        return result[0]
+
+
 class HierarchyBuilder:
     """
     Builds hierarchical JSON from flat tabular data.
@@ -87,24 +186,78 @@ class HierarchyBuilder:
         "decision rule": ["decision rule", "decision_rule", "decision rules", "rule"],
     }
 
-    def __init__(self, root_name: str = "World", sheet_name: str | int | None = None):
+    # Standard columns in the order _row_kernel takes them
+    _ROW_FIELDS = (
+        "group",
+        "topics",
+        "attributes",
+        "descriptions",
+        "definitions",
+        "inclusions",
+        "exclusions",
+        "decision rule",
+        "keywords",
+    )
+
+    # Lower-cased alias -> (standard name, priority); earlier aliases win
+    _ALIAS_TO_STANDARD = {
+        alias.lower(): (standard, rank)
+        for standard, aliases in COLUMN_ALIASES.items()
+        for rank, alias in enumerate(aliases)
+    }
+
+    # Below this many rows, process start-up costs more than it saves
+    PARALLEL_MIN_ROWS = 5000
+
+    # Row numbers listed in a single warning before the rest are only counted
+    MAX_LISTED_ROWS = 20
+
+    def __init__(
+        self,
+        root_name: str = "World",
+        sheet_name: str | int | None = None,
+        max_workers: int | None = None,
+    ):
+        """
+        Args:
+            root_name: Name for the root node
+            sheet_name: For Excel files, the sheet name or index (0-based)
+            max_workers: Build groups in this many worker processes when the
+                         input has at least PARALLEL_MIN_ROWS rows. None or 1
+                         builds in-process.
+        """
         self.root_name = root_name
         self.sheet_name = sheet_name
+        self.max_workers = max_workers
         self.log = BuilderLog()
         self._hierarchy: dict[str, Any] | None = None
 
+    def _is_known_column(self, column: Any) -> bool:
+        """Check whether a column name matches any alias in COLUMN_ALIASES."""
+        return str(column).lower().strip() in self._ALIAS_TO_STANDARD
+
+    def _read_input(self, filepath: str | Path):
+        """Read only the columns the builder can map."""
+        return read_tabular_file(
+            filepath, sheet_name=self.sheet_name, usecols=self._is_known_column
+        )
+
     def _normalize_columns(self, df) -> dict[str, str]:
         """Map actual column names to standard names."""
         column_map = {}
-        df_columns_lower = {col.lower().strip(): col for col in df.columns}
+        ranks: dict[str, int] = {}
 
-        for standard_name, aliases in self.COLUMN_ALIASES.items():
-            for alias in aliases:
-                if alias.lower() in df_columns_lower:
-                    column_map[standard_name] = df_columns_lower[alias.lower()]
-                    break
+        for col in df.columns:
+            match = self._ALIAS_TO_STANDARD.get(str(col).lower().strip())
+            if match is None:
+                continue
+            standard_name, rank = match
+            if rank <= ranks.get(standard_name, rank):
+                column_map[standard_name] = col
+                ranks[standard_name] = rank
 
-        return column_map
+        # Report in COLUMN_ALIASES order regardless of the file's column order
+        return {name: column_map[name] for name in self.COLUMN_ALIASES if name in column_map}
 
     def _parse_list_string(self, value: Any) -> list[str] | None:
         """
@@ -138,51 +291,90 @@ class HierarchyBuilder:
 
     def _parse_keywords(self, value: Any) -> list[str]:
         """Convert keywords to a list, handling various input formats."""
-        if value is None or (isinstance(value, float) and math.isnan(value)):
-            return []
-
         if isinstance(value, list):
             return [str(k).strip() for k in value if k and str(k).strip()]
 
         if isinstance(value, str):
+            value = value.strip()
+
             # Try parsing as list-like string first
-            parsed = self._parse_list_string(value)
-            if parsed is not None:
-                return parsed
+            if value.startswith("[") and value.endswith("]"):
+                parsed = self._parse_list_string(value)
+                if parsed is not None:
+                    return parsed
 
             # Fall back to comma-separated
-            if not value.strip():
+            if not value:
                 return []
             keywords = [k.strip() for k in value.split(",")]
             return [k for k in keywords if k]
 
         return []
 
-    def _parse_string_field(self, value: Any) -> str:
+    def _parse_string_field(self, value: str) -> str:
         """
         Parse a string field, joining list items if it's a list-like string.
         """
-        if value is None:
-            return ""
-        if isinstance(value, float) and math.isnan(value):
-            return ""
+        value_str = value.strip()
 
-        value_str = str(value).strip()
+        # Plain text is the common case; only bracketed values can be lists
+        if not (value_str.startswith("[") and value_str.endswith("]")):
+            return value_str
 
-        # Check if it's a list-like string
         parsed = self._parse_list_string(value_str)
         if parsed is not None:
             return "; ".join(parsed)
 
         return value_str
 
-    def _safe_str(self, value: Any) -> str:
-        """Safely convert value to string, handling NaN and None."""
-        if value is None:
-            return ""
-        if isinstance(value, float) and math.isnan(value):
-            return ""
-        return str(value).strip()
+    def _safe_str(self, value: str) -> str:
+        """Strip a cell value (NaN/None are already filled by _extract_columns)."""
+        return value.strip()
+
+    def _extract_columns(self, df, col_map: dict[str, str]) -> list[list[Any]]:
+        """
+        Pull the mapped columns out as plain lists, in _ROW_FIELDS order.
+
+        Missing values become "" here, once per column, so the per-cell
+        helpers never see NaN or None. Text columns are also cast to str;
+        keywords are left as-is because JSON input may hold real lists.
+        """
+        empty = [""] * len(df)
+        columns = []
+        for name in self._ROW_FIELDS:
+            if name not in col_map:
+                columns.append(empty)
+                continue
+            column = df[col_map[name]].fillna("")
+            if name != "keywords":
+                column = column.astype(str)
+            columns.append(column.tolist())
+        return columns
+
+    def _row_kernel(
+        self,
+        group: Any,
+        topic: Any,
+        attribute: Any,
+        description: Any,
+        definition: Any,
+        inclusions: Any,
+        exclusions: Any,
+        decision_rule: Any,
+        keywords: Any,
+    ) -> tuple[str, str, str, str, str, str, str, str, list[str]]:
+        """Convert the raw cell values of one row into node fields."""
+        return (
+            self._safe_str(group),
+            self._safe_str(topic),
+            self._safe_str(attribute),
+            self._safe_str(description),
+            self._safe_str(definition),
+            self._parse_string_field(inclusions),
+            self._parse_string_field(exclusions),
+            self._safe_str(decision_rule),
+            self._parse_keywords(keywords),
+        )
 
     def _build_scope(self, inclusions: str, exclusions: str) -> str:
         """Combine inclusions and exclusions into a scope string."""
@@ -203,28 +395,24 @@ class HierarchyBuilder:
         decision_rule: str,
     ) -> str:
         """Build a comprehensive definition suitable for classification prompts."""
-        lines = [f"**{name}**", ""]
-
-        if description:
-            lines.append(description)
-            lines.append("")
-
-        if definition:
-            lines.append(f"**Definition:** {definition}")
-            lines.append("")
-
-        if inclusions:
-            lines.append(f"**Includes:** {inclusions}")
-            lines.append("")
-
-        if exclusions:
-            lines.append(f"**Excludes:** {exclusions}")
-            lines.append("")
-
-        if decision_rule:
-            lines.append(f"**Decision Rule:** {decision_rule}")
-
-        return "\n".join(lines).strip()
+        mask = (
+            bool(description)
+            | bool(definition) << 1
+            | bool(inclusions) << 2
+            | bool(exclusions) << 3
+            | bool(decision_rule) << 4
+        )
+        return (
+            _DEFINITION_TEMPLATES[mask]
+            % {
+                "name": name,
+                "description": description,
+                "definition": definition,
+                "inclusions": inclusions,
+                "exclusions": exclusions,
+                "decision_rule": decision_rule,
+            }
+        ).strip()
 
     def _create_node(
         self,
@@ -235,34 +423,35 @@ class HierarchyBuilder:
         exclusions: str = "",
         keywords: list[str] | None = None,
         decision_rule: str = "",
-    ) -> dict[str, Any]:
+    ) -> HierarchyNode:
         """Create a hierarchy node with all required fields."""
-        keywords = keywords or []
-        scope = self._build_scope(inclusions, exclusions)
-        comprehensive_definition = self._build_comprehensive_definition(
-            name, description, definition, inclusions, exclusions, decision_rule
+        # Root and auto-created placeholders have no metadata: skip the builders
+        if not (description or definition or inclusions or exclusions or decision_rule):
+            return HierarchyNode(
+                name=name, keywords=keywords or [], comprehensive_definition=f"**{name}**"
+            )
+
+        return HierarchyNode(
+            name=name,
+            keywords=keywords or [],
+            definition=definition,
+            description=description,
+            scope=self._build_scope(inclusions, exclusions),
+            inclusions=inclusions,
+            exclusions=exclusions,
+            decision_rule=decision_rule,
+            comprehensive_definition=self._build_comprehensive_definition(
+                name, description, definition, inclusions, exclusions, decision_rule
+            ),
         )
 
-        return {
-            "name": name,
-            "keywords": keywords,
-            "definition": definition,
-            "description": description,
-            "scope": scope,
-            "inclusions": inclusions,
-            "exclusions": exclusions,
-            "decision_rule": decision_rule,
-            "comprehensive_definition": comprehensive_definition,
-            "children": [],
-        }
-
-    def _create_root_node(self) -> dict[str, Any]:
+    def _create_root_node(self) -> HierarchyNode:
         """Create the root node with default empty values."""
         return self._create_node(self.root_name)
 
     def _update_node(
         self,
-        node: dict[str, Any],
+        node: HierarchyNode,
         description: str,
         definition: str,
         inclusions: str,
@@ -271,15 +460,15 @@ class HierarchyBuilder:
         decision_rule: str,
     ):
         """Update an existing node with new metadata."""
-        node["description"] = description
-        node["definition"] = definition
-        node["inclusions"] = inclusions
-        node["exclusions"] = exclusions
-        node["keywords"] = keywords
-        node["decision_rule"] = decision_rule
-        node["scope"] = self._build_scope(inclusions, exclusions)
-        node["comprehensive_definition"] = self._build_comprehensive_definition(
-            node["name"], description, definition, inclusions, exclusions, decision_rule
+        node.description = description
+        node.definition = definition
+        node.inclusions = inclusions
+        node.exclusions = exclusions
+        node.keywords = keywords
+        node.decision_rule = decision_rule
+        node.scope = self._build_scope(inclusions, exclusions)
+        node.comprehensive_definition = self._build_comprehensive_definition(
+            node.name, description, definition, inclusions, exclusions, decision_rule
         )
 
     def build(self, filepath: str | Path) -> dict[str, Any]:
@@ -294,45 +483,73 @@ class HierarchyBuilder:
         """
         self.log = BuilderLog()
 
-        df = read_tabular_file(filepath, sheet_name=self.sheet_name)
+        df = self._read_input(filepath)
         col_map = self._normalize_columns(df)
 
         if "group" not in col_map:
             self.log.error("Missing required 'group' column")
             raise ValueError("Missing required 'group' column")
 
+        # Drop rows without a group in one pass instead of checking per row
+        empty_group = df[col_map["group"]].fillna("").astype(str).str.strip() == ""
+        if empty_group.any():
+            # Name the first few skipped rows (spreadsheet numbering) and count the rest
+            skipped_rows = df.index[empty_group]
+            shown = self.MAX_LISTED_ROWS
+            skipped = ", ".join(str(idx + 2) for idx in skipped_rows[:shown])
+            if len(skipped_rows) > shown:
+                skipped += f" (+{len(skipped_rows) - shown} more)"
+            self.log.warn(f"Empty group name, skipping rows {skipped}")
+            df = df[~empty_group]
+
         root = self._create_root_node()
 
-        groups: dict[str, dict[str, Any]] = {}
-        topics: dict[tuple[str, str], dict[str, Any]] = {}
+        columns = self._extract_columns(df, col_map)
+        rows = zip(df.index, zip(*columns))
 
-        for idx, row in df.iterrows():
-            row_num = idx + 2
+        if self.max_workers and self.max_workers > 1 and len(df) >= self.PARALLEL_MIN_ROWS:
+            root.children = self._build_subtrees_parallel(rows)
+        else:
+            root.children = self._build_subtrees(rows)
 
-            group_name = self._safe_str(row.get(col_map.get("group", ""), ""))
-            topic_name = self._safe_str(row.get(col_map.get("topics", ""), ""))
-            attr_name = self._safe_str(row.get(col_map.get("attributes", ""), ""))
+        # Only the dict is kept; the node tree is released when build() returns
+        self._hierarchy = root.to_dict()
+        return self._hierarchy
 
-            description = self._safe_str(row.get(col_map.get("descriptions", ""), ""))
-            definition = self._safe_str(row.get(col_map.get("definitions", ""), ""))
-            inclusions = self._parse_string_field(row.get(col_map.get("inclusions", ""), ""))
-            exclusions = self._parse_string_field(row.get(col_map.get("exclusions", ""), ""))
-            decision_rule = self._safe_str(row.get(col_map.get("decision rule", ""), ""))
-            keywords = self._parse_keywords(row.get(col_map.get("keywords", ""), ""))
+    def _build_subtrees(self, rows: Iterable[tuple[int, tuple[Any, ...]]]) -> list[HierarchyNode]:
+        """
+        Build group subtrees from (index, raw cell values) rows. Rows must
+        already have a non-empty group (see build()).
 
-            if not group_name:
-                self.log.warn("Empty group name, skipping row", row_num)
-                continue
+        Returns:
+            Group nodes in the order they were first seen
+        """
+        group_nodes: list[HierarchyNode] = []
+        groups: dict[str, HierarchyNode] = {}
+        topics: dict[tuple[str, str], HierarchyNode] = {}
+
+        for idx, values in rows:
+            (
+                group_name,
+                topic_name,
+                attr_name,
+                description,
+                definition,
+                inclusions,
+                exclusions,
+                decision_rule,
+                keywords,
+            ) = self._row_kernel(*values)
 
             if not topic_name and not attr_name:
                 # GROUP level
                 if group_name in groups:
-                    self.log.warn(f"Duplicate group '{group_name}', updating existing", row_num)
+                    self.log.warn(f"Duplicate group '{group_name}', updating existing", idx + 2)
                     node = groups[group_name]
                 else:
                     node = self._create_node(group_name)
                     groups[group_name] = node
-                    root["children"].append(node)
+                    group_nodes.append(node)
 
                 self._update_node(
                     node,
@@ -348,23 +565,23 @@ class HierarchyBuilder:
                 # TOPIC level
                 if group_name not in groups:
                     self.log.warn(
-                        f"Group '{group_name}' not previously defined, auto-creating", row_num
+                        f"Group '{group_name}' not previously defined, auto-creating", idx + 2
                     )
                     group_node = self._create_node(group_name)
                     groups[group_name] = group_node
-                    root["children"].append(group_node)
+                    group_nodes.append(group_node)
 
                 topic_key = (group_name, topic_name)
                 if topic_key in topics:
                     self.log.warn(
                         f"Duplicate topic '{topic_name}' under '{group_name}', updating existing",
-                        row_num,
+                        idx + 2,
                     )
                     node = topics[topic_key]
                 else:
                     node = self._create_node(topic_name)
                     topics[topic_key] = node
-                    groups[group_name]["children"].append(node)
+                    groups[group_name].children.append(node)
 
                 self._update_node(
                     node,
@@ -380,7 +597,7 @@ class HierarchyBuilder:
                 # ATTRIBUTE without TOPIC - warn and skip
                 self.log.warn(
                     f"Attribute '{attr_name}' has no parent topic under '{group_name}', skipping",
-                    row_num,
+                    idx + 2,
                 )
                 continue
 
@@ -388,21 +605,21 @@ class HierarchyBuilder:
                 # ATTRIBUTE level (both topic_name and attr_name present)
                 if group_name not in groups:
                     self.log.warn(
-                        f"Group '{group_name}' not previously defined, auto-creating", row_num
+                        f"Group '{group_name}' not previously defined, auto-creating", idx + 2
                     )
                     group_node = self._create_node(group_name)
                     groups[group_name] = group_node
-                    root["children"].append(group_node)
+                    group_nodes.append(group_node)
 
                 topic_key = (group_name, topic_name)
                 if topic_key not in topics:
                     self.log.warn(
                         f"Topic '{topic_name}' under '{group_name}' not previously defined, auto-creating",
-                        row_num,
+                        idx + 2,
                     )
                     topic_node = self._create_node(topic_name)
                     topics[topic_key] = topic_node
-                    groups[group_name]["children"].append(topic_node)
+                    groups[group_name].children.append(topic_node)
 
                 attr_node = self._create_node(
                     attr_name,
@@ -413,16 +630,54 @@ class HierarchyBuilder:
                     keywords,
                     decision_rule,
                 )
-                topics[topic_key]["children"].append(attr_node)
+                topics[topic_key].children.append(attr_node)
 
-        self._hierarchy = root
-        return root
+        return group_nodes
+
+    def _build_subtrees_parallel(
+        self, rows: Iterable[tuple[int, tuple[Any, ...]]]
+    ) -> list[HierarchyNode]:
+        """
+        Build group subtrees in worker processes, one partition per group.
+
+        Rows of different groups never touch the same subtree, so each
+        group is built independently and the results are concatenated in
+        first-seen order. Log messages are merged group by group rather
+        than strictly by row.
+        """
+        partitions: dict[str, list[tuple[int, tuple[Any, ...]]]] = {}
+        for idx, values in rows:
+            partitions.setdefault(self._safe_str(values[0]), []).append((idx, values))
+
+        chunksize = max(1, len(partitions) // (self.max_workers * 4))
+        group_nodes: list[HierarchyNode] = []
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for nodes, log in executor.map(
+                _build_partition, partitions.values(), chunksize=chunksize
+            ):
+                group_nodes.extend(nodes)
+                self.log.merge(log)
+
+        return group_nodes
 
     def save(self, filepath: str | Path, indent: int = 2) -> Path:
         """Save the hierarchy to a JSON file."""
         if self._hierarchy is None:
             raise ValueError("No hierarchy built yet. Call build() first.")
-        return save_json(self._hierarchy, filepath, indent=indent)
+
+        # Both writers serialize the dict returned by build()/to_dict(), so
+        # edits made to it are saved whatever the indent. orjson only
+        # supports 2-space indentation; anything else goes through json
+        hierarchy = self.to_dict()
+        if orjson is not None and indent == 2:
+            filepath = Path(filepath)
+            filepath.write_bytes(
+                orjson.dumps(hierarchy, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+            return filepath
+
+        return save_json(hierarchy, filepath, indent=indent)
 
     def to_dict(self) -> dict[str, Any]:
         """Return the hierarchy as a Python dictionary."""
@@ -439,7 +694,7 @@ class HierarchyBuilder:
         Show how columns in the file map to standard column names.
         Useful for debugging.
         """
-        df = read_tabular_file(filepath, sheet_name=self.sheet_name)
+        df = self._read_input(filepath)
         return self._normalize_columns(df)
 
     def print_log(self):
@@ -447,12 +702,21 @@ class HierarchyBuilder:
         print(self.log.summary())
 
 
+def _build_partition(
+    rows: list[tuple[int, tuple[Any, ...]]],
+) -> tuple[list[HierarchyNode], BuilderLog]:
+    """Worker entry point for HierarchyBuilder._build_subtrees_parallel."""
+    builder = HierarchyBuilder()
+    return builder._build_subtrees(rows), builder.log
+
+
 def build_hierarchy(
     input_file: str | Path,
     output_file: str | Path | None = None,
     root_name: str = "World",
     sheet_name: str | int | None = None,
     indent: int = 2,
+    max_workers: int | None = None,
 ) -> tuple[dict[str, Any], BuilderLog]:
     """
     Convenience function to build hierarchy from file.
@@ -463,11 +727,12 @@ def build_hierarchy(
         root_name: Name for the root node
         sheet_name: For Excel files, the sheet name or index (0-based)
         indent: JSON indentation level
+        max_workers: Worker processes for large inputs (see HierarchyBuilder)
 
     Returns:
         Tuple of (hierarchy dict, build log)
     """
-    builder = HierarchyBuilder(root_name=root_name, sheet_name=sheet_name)
+    builder = HierarchyBuilder(root_name=root_name, sheet_name=sheet_name, max_workers=max_workers)
     hierarchy = builder.build(input_file)
 
     if output_file:
@@ -0,0 +1,41 @@
+"""
+Shared pytest fixtures for the classifier component tests.
+
+Building the content provider and schema factory is the expensive part of
+most tests, so a single instance of each is shared across the session. The
+builders live in fixture_builders.py, which the standalone runner in
+test_components.py uses as well.
+"""
+
+import pytest
+
+from fixture_builders import (
+    build_all_stage2_schemas,
+    build_content,
+    build_exported_prompts,
+    build_factory,
+)
+
+
+@pytest.fixture(scope="session")
+def content():
+    """Handcrafted taxonomy content shared by all tests."""
+    return build_content()
+
+
+@pytest.fixture(scope="session")
+def factory(content):
+    """Schema factory over the shared content."""
+    return build_factory(content)
+
+
+@pytest.fixture(scope="session")
+def all_stage2_schemas(content, factory):
+    """Stage 2 schemas for every category that has elements, built once."""
+    return build_all_stage2_schemas(content, factory)
+
+
+@pytest.fixture(scope="session")
+def exported_prompts(tmp_path_factory, content, factory):
+    """Prompts exported once from the shared content: (export result, output dir)."""
+    return build_exported_prompts(content, factory, tmp_path_factory.mktemp("prompts_export"))
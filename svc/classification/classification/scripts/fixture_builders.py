@@ -0,0 +1,42 @@
+"""
+Builders for the shared classifier test fixtures.
+
+conftest.py wraps these as session fixtures for pytest, and
+test_components.run_tests() caches them for the standalone runner, so both
+paths build the same objects.
+"""
+
+from pathlib import Path
+
+
+def build_content():
+    """Handcrafted taxonomy content shared by all tests."""
+    from classifier import HandcraftedContentProvider
+
+    return HandcraftedContentProvider()
+
+
+def build_factory(content):
+    """Schema factory over the shared content."""
+    from classifier import TaxonomySchemaFactory
+
+    return TaxonomySchemaFactory(content)
+
+
+def build_all_stage2_schemas(content, factory) -> dict:
+    """Stage 2 schemas for every category that has elements."""
+    schemas = {}
+    for category in content.get_all_category_names():
+        try:
+            schemas[category] = factory.get_stage2_schema(category)
+        except ValueError:
+            pass  # No elements for this category
+    return schemas
+
+
+def build_exported_prompts(content, factory, output_dir: Path) -> tuple:
+    """Export prompts from the shared content: (export result, output dir)."""
+    from classifier import PromptExporter
+
+    result = PromptExporter(content, factory).export_prompts(str(output_dir), verbose=False)
+    return result, output_dir
@@ -11,22 +11,6 @@ from classifier import (
 scaffold_artifacts(
     "/data-fast/data3/clyde/projects/world/documents/schemas/schema_v1.json", "./artifacts_test"
 )
-artifacts_path = "/data-fast/data3/clyde/projects/world/documents/output_files/new_tests_yaml"
-content = YAMLContentProvider(artifacts_path, verbose=True)
-
-# Check what was loaded
-print(f"Categories: {content.get_all_category_names()}")
-for cat in content.get_all_category_names():
-    elements = content.get_all_element_names(cat)
-    print(f"  {cat}: {elements}")
-
-# 2. Get examples and rules
-stage1_examples = content.get_examples("stage1")
-print(f"\nStage 1 examples: {len(stage1_examples)}")
-
-stage2_examples = content.get_examples("stage2", category="People")
-print(f"Stage 2 examples for People: {len(stage2_examples)}")
-
 
 # 1. Load content from your existing artifacts
 artifacts_path = "/data-fast/data3/clyde/projects/world/documents/output_files/new_tests_yaml"
@@ -46,10 +30,18 @@ stage2_examples = content.get_examples("stage2", category="People")
 print(f"Stage 2 examples for People: {len(stage2_examples)}")
 
 # 3. Build pipeline
+# One schema factory is shared by the pipeline and the exporter below, so the
+# pydantic models are only built once
 schema_factory = TaxonomySchemaFactory(content)
 llm = MockLLMClient()  # Replace with VLLMClient(processor) for real inference
 
-pipeline = PipelineBuilder().with_content(content).with_llm(llm).build()
+pipeline = (
+    PipelineBuilder()
+    .with_content(content)
+    .with_schema_factory(schema_factory)
+    .with_llm(llm)
+    .build()
+)
 
 # 4. Run classification
 texts = ["The speaker was amazing and very knowledgeable!", "WiFi was terrible."]
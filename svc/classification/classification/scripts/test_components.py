@@ -13,24 +13,100 @@ Run with: pytest test_components.py -v
 Or directly: python test_components.py
 """
 
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import inspect
 import json
+import os
 from pathlib import Path
+import py_compile
+import shutil
 import sys
 import tempfile
+import traceback
+from typing import List, Literal, get_args, get_origin
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from classifier import (
+    HandcraftedContentProvider,
+    MockLLMClient,
+    PipelineBuilder,
+    TaxonomySchemaFactory,
+    YAMLContentProvider,
+    scaffold_artifacts,
+)
+from classifier.content import CompositeContentProvider
+from classifier.infrastructure import RecordingLLMClient
+from classifier.pipeline import (
+    PipelineContext,
+    PipelineOrchestrator,
+    ResultMerger,
+    StageRegistry,
+    create_default_registry,
+)
+from classifier.schemas.base import SentimentType
+from classifier.schemas.factory import _build_stage3_schema
+from classifier.stages import (
+    AttributeExtractionStage,
+    CategoryDetectionStage,
+    ElementExtractionStage,
+)
+from fixture_builders import (
+    build_all_stage2_schemas,
+    build_content,
+    build_exported_prompts,
+    build_factory,
+)
+from pydantic import BaseModel
+
+
+# =============================================================================
+# Shared Fixtures (standalone runner)
+# =============================================================================
+# Under pytest these come from conftest.py; run_tests() injects the cached
+# instances below by parameter name. Both wrap the builders in
+# fixture_builders.py, so they build the same objects, once each.
+
+
+@lru_cache(maxsize=1)
+def _get_content():
+    return build_content()
+
+
+@lru_cache(maxsize=1)
+def _get_factory():
+    return build_factory(_get_content())
+
+
+@lru_cache(maxsize=1)
+def _get_all_stage2_schemas():
+    return build_all_stage2_schemas(_get_content(), _get_factory())
+
+
+@lru_cache(maxsize=1)
+def _get_exported_prompts():
+    output_dir = Path(tempfile.mkdtemp(prefix="prompts_export_"))
+    atexit.register(shutil.rmtree, output_dir, ignore_errors=True)
+    return build_exported_prompts(_get_content(), _get_factory(), output_dir)
+
+
+_FIXTURES = {
+    "content": _get_content,
+    "factory": _get_factory,
+    "all_stage2_schemas": _get_all_stage2_schemas,
+    "exported_prompts": _get_exported_prompts,
+}
+
 
 class TestContentProviders:
     """Test content provider implementations."""
 
-    def test_handcrafted_provider_loads_categories(self):
+    def test_handcrafted_provider_loads_categories(self, content):
         """HandcraftedContentProvider should load predefined categories."""
-        from classifier import HandcraftedContentProvider
-
-        provider = HandcraftedContentProvider()
-        categories = provider.get_categories()
+        categories = content.get_categories()
 
         assert len(categories) > 0, "Should have at least one category"
         assert all(hasattr(c, "name") for c in categories), "Categories should have names"
@@ -38,36 +114,26 @@ class TestContentProviders:
             "Categories should have descriptions"
         )
 
-    def test_handcrafted_provider_loads_elements(self):
+    def test_handcrafted_provider_loads_elements(self, content):
         """HandcraftedContentProvider should load elements for categories."""
-        from classifier import HandcraftedContentProvider
-
-        provider = HandcraftedContentProvider()
-        categories = provider.get_categories()
+        categories = content.get_categories()
 
         if categories:
             cat_name = categories[0].name
-            elements = provider.get_elements(cat_name)
+            elements = content.get_elements(cat_name)
             # May or may not have elements depending on content
             assert isinstance(elements, list), "Should return a list"
 
-    def test_handcrafted_provider_examples_and_rules(self):
+    def test_handcrafted_provider_examples_and_rules(self, content):
         """HandcraftedContentProvider should return examples and rules."""
-        from classifier import HandcraftedContentProvider
-
-        provider = HandcraftedContentProvider()
-
-        stage1_examples = provider.get_examples("stage1")
-        stage1_rules = provider.get_rules("stage1")
+        stage1_examples = content.get_examples("stage1")
+        stage1_rules = content.get_rules("stage1")
 
         assert isinstance(stage1_examples, list), "Examples should be a list"
         assert isinstance(stage1_rules, list), "Rules should be a list"
 
     def test_yaml_provider_requires_existing_directory(self):
         """YAMLContentProvider should raise error for missing directory."""
-        from classifier import YAMLContentProvider
-        import pytest
-
         with tempfile.TemporaryDirectory() as tmpdir:
             nonexistent = Path(tmpdir) / "nonexistent"
 
@@ -77,31 +143,54 @@ class TestContentProviders:
             except FileNotFoundError:
                 pass  # Expected
 
-    def test_composite_provider_priority(self):
+    def test_yaml_provider_threaded_scan_matches_sequential(self):
+        """YAMLContentProvider(max_workers=...) should load the same structure."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            for c in range(4):
+                elem_dir = root / f"cat_{c}" / "elem"
+                elem_dir.mkdir(parents=True)
+                (root / f"cat_{c}" / "_category.yaml").write_text(f"name: Category {c}\n")
+                (elem_dir / "_element.yaml").write_text(f"name: Element {c}\n")
+                (elem_dir / "attr.yaml").write_text(f"name: Attribute {c}\n")
+
+            sequential = YAMLContentProvider(str(root))
+            threaded = YAMLContentProvider(str(root), max_workers=4)
+
+            assert threaded.get_all_category_names() == sequential.get_all_category_names()
+            assert threaded._attribute_files == sequential._attribute_files
+            assert len(threaded.get_all_category_names()) == 4
+
+    def test_composite_provider_priority(self, content):
         """CompositeContentProvider should respect priority ordering."""
-        from classifier.content import CompositeContentProvider, HandcraftedContentProvider
-
-        provider1 = HandcraftedContentProvider()
-        provider2 = HandcraftedContentProvider()
-
-        composite = CompositeContentProvider([provider1, provider2])
+        composite = CompositeContentProvider([content, HandcraftedContentProvider()])
         categories = composite.get_categories()
 
         # Should return from first provider
-        assert categories == provider1.get_categories()
+        assert categories == content.get_categories()
+
+
+def _schema_shape(schema) -> list:
+    """Field names and Literal values of a schema and its nested models, for comparing rebuilds."""
+    shape = []
+    for name, field_info in schema.model_fields.items():
+        annotation = field_info.annotation
+        if get_origin(annotation) is list:
+            annotation = get_args(annotation)[0]
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            shape.append((name, _schema_shape(annotation)))
+        elif get_origin(annotation) is Literal:
+            shape.append((name, get_args(annotation)))
+        else:
+            shape.append((name, annotation))
+    return shape
 
 
 class TestSchemaFactory:
     """Test schema factory implementations."""
 
-    def test_taxonomy_schema_factory_creates_stage1_schema(self):
+    def test_taxonomy_schema_factory_creates_stage1_schema(self, factory):
         """TaxonomySchemaFactory should create a valid Stage 1 schema."""
-        from classifier import HandcraftedContentProvider, TaxonomySchemaFactory
-        from pydantic import BaseModel
-
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-
         schema = factory.get_stage1_schema()
 
         assert issubclass(schema, BaseModel), "Should be a Pydantic model"
@@ -109,89 +198,98 @@ class TestSchemaFactory:
             "Should have categories_present field"
         )
 
-    def test_taxonomy_schema_factory_creates_stage2_schemas(self):
+    def test_taxonomy_schema_factory_creates_stage2_schemas(self, all_stage2_schemas):
         """TaxonomySchemaFactory should create Stage 2 schemas per category."""
-        from classifier import HandcraftedContentProvider, TaxonomySchemaFactory
-
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-
-        categories = content.get_all_category_names()
-        if not categories:
-            return  # Skip if no categories
-
-        for cat in categories:
-            try:
-                schema = factory.get_stage2_schema(cat)
-                assert "elements" in schema.model_fields, (
-                    f"Schema for {cat} should have elements field"
-                )
-            except ValueError:
-                pass  # May fail if no elements for category
+        for cat, schema in all_stage2_schemas.items():
+            assert "elements" in schema.model_fields, (
+                f"Schema for {cat} should have elements field"
+            )
 
-    def test_schema_factory_caches_schemas(self):
+    def test_schema_factory_caches_schemas(self, factory, all_stage2_schemas):
         """Schema factory should cache generated schemas."""
-        from classifier import HandcraftedContentProvider, TaxonomySchemaFactory
-
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-
         schema1 = factory.get_stage1_schema()
         schema2 = factory.get_stage1_schema()
 
         assert schema1 is schema2, "Should return cached schema"
 
+        for cat, schema in all_stage2_schemas.items():
+            assert factory.get_stage2_schema(cat) is schema, (
+                f"Should return cached Stage 2 schema for {cat}"
+            )
+
+    def test_schema_factory_reuses_schemas_across_instances(self, content, factory):
+        """A new factory over the same taxonomy should reuse the built schemas."""
+        fresh = TaxonomySchemaFactory(content)
+
+        assert fresh.get_stage1_schema() is factory.get_stage1_schema(), (
+            "Should reuse the Stage 1 schema built by another factory"
+        )
+        for cat, schema in factory.get_all_stage2_schemas().items():
+            assert fresh.get_stage2_schema(cat) is schema, (
+                f"Should reuse the Stage 2 schema for {cat}"
+            )
+
+    def test_schema_factory_threaded_build_matches_sequential(self):
+        """Building Stage 3 schemas on a thread pool should give the same schemas."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            # Names unique to this run, so the memoized builders miss and the
+            # pool really builds every schema
+            tag = root.name
+            for c in range(3):
+                cat_dir = root / f"cat_{c}"
+                for e in range(3):
+                    elem_dir = cat_dir / f"elem_{e}"
+                    elem_dir.mkdir(parents=True)
+                    (elem_dir / "_element.yaml").write_text(f"name: Element {tag} {c}.{e}\n")
+                    # elem_0 has no attributes
+                    for a in range(e):
+                        (elem_dir / f"attr_{a}.yaml").write_text(
+                            f"name: Attribute {tag} {c}.{e}.{a}\n"
+                        )
+                (cat_dir / "_category.yaml").write_text(f"name: Category {tag} {c}\n")
+
+            content = YAMLContentProvider(str(root))
+            threaded = TaxonomySchemaFactory(content).get_all_stage3_schemas(max_workers=4)
+
+            assert len(threaded) == 9
+            for key, schema in threaded.items():
+                category, element = key.split(":")
+                attribute_names = tuple(content.get_all_attribute_names(category, element))
+                # Build the same schema again, one at a time and bypassing the cache
+                sequential = _build_stage3_schema.__wrapped__(category, element, attribute_names)
+
+                assert _schema_shape(schema) == _schema_shape(sequential), (
+                    f"Threaded Stage 3 schema for {key} should match the sequential one"
+                )
+
 
 class TestPipelineStages:
     """Test individual pipeline stages."""
 
-    def test_category_detection_stage_properties(self):
+    def test_category_detection_stage_properties(self, content, factory):
         """CategoryDetectionStage should have correct properties."""
-        from classifier import HandcraftedContentProvider, TaxonomySchemaFactory
-        from classifier.stages import CategoryDetectionStage
-
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-
         stage = CategoryDetectionStage(content, factory)
 
         assert stage.name == "category_detection"
         assert stage.dependencies == []
 
-    def test_element_extraction_stage_dependencies(self):
+    def test_element_extraction_stage_dependencies(self, content, factory):
         """ElementExtractionStage should depend on category_detection."""
-        from classifier import HandcraftedContentProvider, TaxonomySchemaFactory
-        from classifier.stages import ElementExtractionStage
-
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-
         stage = ElementExtractionStage(content, factory)
 
         assert stage.name == "element_extraction"
         assert "category_detection" in stage.dependencies
 
-    def test_attribute_extraction_stage_dependencies(self):
+    def test_attribute_extraction_stage_dependencies(self, content, factory):
         """AttributeExtractionStage should depend on element_extraction."""
-        from classifier import HandcraftedContentProvider, TaxonomySchemaFactory
-        from classifier.stages import AttributeExtractionStage
-
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-
         stage = AttributeExtractionStage(content, factory)
 
         assert stage.name == "attribute_extraction"
         assert "element_extraction" in stage.dependencies
 
-    def test_stage_builds_prompt(self):
+    def test_stage_builds_prompt(self, content, factory):
         """Stages should be able to build prompts."""
-        from classifier import HandcraftedContentProvider, TaxonomySchemaFactory
-        from classifier.stages import CategoryDetectionStage
-
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-
         stage = CategoryDetectionStage(content, factory)
 
         text = "The speaker was excellent!"
@@ -207,8 +305,6 @@ class TestPipelineOrchestrator:
 
     def test_pipeline_builder_requires_content(self):
         """PipelineBuilder should require content provider."""
-        from classifier import MockLLMClient, PipelineBuilder
-
         builder = PipelineBuilder()
         builder.with_llm(MockLLMClient())
 
@@ -218,12 +314,10 @@ class TestPipelineOrchestrator:
         except ValueError as e:
             assert "content" in str(e).lower()
 
-    def test_pipeline_builder_requires_llm(self):
+    def test_pipeline_builder_requires_llm(self, content):
         """PipelineBuilder should require LLM client."""
-        from classifier import HandcraftedContentProvider, PipelineBuilder
-
         builder = PipelineBuilder()
-        builder.with_content(HandcraftedContentProvider())
+        builder.with_content(content)
 
         try:
             builder.build()
@@ -231,32 +325,22 @@ class TestPipelineOrchestrator:
         except ValueError as e:
             assert "llm" in str(e).lower()
 
-    def test_pipeline_builder_creates_orchestrator(self):
+    def test_pipeline_builder_creates_orchestrator(self, content):
         """PipelineBuilder should create a PipelineOrchestrator."""
-        from classifier import HandcraftedContentProvider, MockLLMClient, PipelineBuilder
-
         pipeline = (
             PipelineBuilder()
-            .with_content(HandcraftedContentProvider())
+            .with_content(content)
             .with_llm(MockLLMClient())
             .build()
         )
 
-        from classifier.pipeline import PipelineOrchestrator
-
         assert isinstance(pipeline, PipelineOrchestrator)
 
-    def test_pipeline_runs_with_mock_llm(self):
+    def test_pipeline_runs_with_mock_llm(self, content):
         """Pipeline should run with MockLLMClient."""
-        from classifier import (
-            HandcraftedContentProvider,
-            MockLLMClient,
-            PipelineBuilder,
-        )
-
         pipeline = (
             PipelineBuilder()
-            .with_content(HandcraftedContentProvider())
+            .with_content(content)
             .with_llm(MockLLMClient())
             .verbose(False)
             .build()
@@ -268,34 +352,41 @@ class TestPipelineOrchestrator:
         assert len(results) == 1
         assert texts[0] in results
 
+    def test_pipeline_batches_all_texts_per_stage(self, content):
+        """Each stage should send all of its prompts in one batch_generate call."""
+        llm = RecordingLLMClient(MockLLMClient())
+        pipeline = (
+            PipelineBuilder()
+            .with_content(content)
+            .with_llm(llm)
+            .verbose(False)
+            .build()
+        )
+
+        texts = ["The speaker was great!", "WiFi was terrible.", "Loved the dinner."]
+        pipeline.run(texts, stages=["category_detection", "element_extraction"])
+
+        assert [call["type"] for call in llm.calls] == ["batch_generate"] * 2, (
+            "Should make one batched LLM call per stage"
+        )
+        assert len(llm.calls[0]["prompts"]) == len(texts), (
+            "Stage 1 batch should hold one prompt per text"
+        )
+
 
 class TestStageRegistry:
     """Test stage registry functionality."""
 
-    def test_registry_registers_stages(self):
+    def test_registry_registers_stages(self, content, factory):
         """StageRegistry should register stages."""
-        from classifier import HandcraftedContentProvider, TaxonomySchemaFactory
-        from classifier.pipeline import StageRegistry
-        from classifier.stages import CategoryDetectionStage
-
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-
         registry = StageRegistry()
         stage = CategoryDetectionStage(content, factory)
         registry.register(stage)
 
         assert "category_detection" in registry.list_stages()
 
-    def test_registry_prevents_duplicate_registration(self):
+    def test_registry_prevents_duplicate_registration(self, content, factory):
         """StageRegistry should prevent duplicate stage names."""
-        from classifier import HandcraftedContentProvider, TaxonomySchemaFactory
-        from classifier.pipeline import StageRegistry
-        from classifier.stages import CategoryDetectionStage
-
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-
         registry = StageRegistry()
         stage = CategoryDetectionStage(content, factory)
         registry.register(stage)
@@ -306,14 +397,8 @@ class TestStageRegistry:
         except ValueError:
             pass
 
-    def test_registry_resolves_dependencies(self):
+    def test_registry_resolves_dependencies(self, content, factory):
         """StageRegistry should resolve stage dependencies correctly."""
-        from classifier import HandcraftedContentProvider, TaxonomySchemaFactory
-        from classifier.pipeline import StageRegistry, create_default_registry
-
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-
         registry = create_default_registry(content, factory)
 
         # Request only element_extraction, should include category_detection
@@ -329,8 +414,6 @@ class TestResultMerger:
 
     def test_merger_merges_empty_context(self):
         """ResultMerger should handle empty context."""
-        from classifier.pipeline import PipelineContext, ResultMerger
-
         context = PipelineContext()
         merger = ResultMerger()
 
@@ -340,8 +423,6 @@ class TestResultMerger:
 
     def test_merger_to_flat_records_empty(self):
         """ResultMerger.to_flat_records should handle empty results."""
-        from classifier.pipeline import ResultMerger
-
         merger = ResultMerger()
         records = merger.to_flat_records({})
 
@@ -353,10 +434,6 @@ class TestMockLLMClient:
 
     def test_mock_client_generates_response(self):
         """MockLLMClient should generate mock responses."""
-        from typing import List
-
-        from classifier import MockLLMClient
-        from pydantic import BaseModel
 
         class TestSchema(BaseModel):
             items: List[str]
@@ -370,8 +447,6 @@ class TestMockLLMClient:
 
     def test_mock_client_tracks_calls(self):
         """MockLLMClient should track call history."""
-        from classifier import MockLLMClient
-        from pydantic import BaseModel
 
         class SimpleSchema(BaseModel):
             value: str
@@ -387,8 +462,6 @@ class TestMockLLMClient:
 
     def test_mock_client_batch_generate(self):
         """MockLLMClient should handle batch generation."""
-        from classifier import MockLLMClient
-        from pydantic import BaseModel
 
         class SimpleSchema(BaseModel):
             value: str
@@ -403,52 +476,141 @@ class TestMockLLMClient:
         assert len(responses) == 3
         assert all(r.parsed is not None for r in responses)
 
+    def test_mock_client_matches_first_added_response_key(self):
+        """MockLLMClient should use the earliest-added key found in the prompt."""
 
-class TestPromptExporter:
-    """Test prompt exporter functionality."""
+        class SimpleSchema(BaseModel):
+            value: str
 
-    def test_exporter_exports_prompts(self):
-        """PromptExporter should export prompt files."""
-        from classifier import HandcraftedContentProvider, PromptExporter, TaxonomySchemaFactory
+        client = MockLLMClient(
+            responses={
+                "excellent": {"value": "first"},
+                "speakers were excellent": {"value": "second"},
+            },
+            default_response={"value": "default"},
+        )
 
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-        exporter = PromptExporter(content, factory)
+        assert client.generate("The speakers were excellent", SimpleSchema).parsed.value == "first"
+        assert client.generate("Nothing matches", SimpleSchema).parsed.value == "default"
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = exporter.export_prompts(tmpdir, verbose=False)
+    def test_mock_client_picks_up_response_changes(self):
+        """MockLLMClient should match keys added or changed after construction."""
 
-            assert result["files_created"] > 0
+        class SimpleSchema(BaseModel):
+            value: str
 
-            prompts_dir = Path(tmpdir) / "prompts"
-            assert prompts_dir.exists()
+        client = MockLLMClient(
+            responses={"excellent": {"value": "first"}},
+            default_response={"value": "default"},
+        )
+        assert client.generate("Lunch was great", SimpleSchema).parsed.value == "default"
 
-            # Check stage1 directory
-            stage1_dir = prompts_dir / "stage1"
-            assert stage1_dir.exists()
+        client.responses["great"] = {"value": "added"}
+        client.responses["excellent"] = {"value": "changed"}
 
-    def test_exporter_creates_valid_python(self):
-        """PromptExporter should create valid Python files."""
-        import ast
+        assert client.generate("Lunch was great!", SimpleSchema).parsed.value == "added"
+        assert client.generate("Talks were excellent", SimpleSchema).parsed.value == "changed"
 
-        from classifier import HandcraftedContentProvider, PromptExporter, TaxonomySchemaFactory
+    def test_mock_client_memoizes_repeated_prompts(self):
+        """MockLLMClient(cache_size=...) should reuse responses but record every call."""
 
-        content = HandcraftedContentProvider()
-        factory = TaxonomySchemaFactory(content)
-        exporter = PromptExporter(content, factory)
+        class SimpleSchema(BaseModel):
+            value: str
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            exporter.export_prompts(tmpdir, verbose=False)
+        client = MockLLMClient(cache_size=16)
+
+        first = client.generate("same prompt", SimpleSchema)
+        second = client.generate("same prompt", SimpleSchema)
+
+        assert second is first
+        assert client.get_call_count() == 2
+
+        client.clear_cache()
+        assert client.generate("same prompt", SimpleSchema) is not first
+
+    def test_mock_client_does_not_memoize_by_default(self):
+        """MockLLMClient() should pick up response edits between calls."""
 
-            prompts_dir = Path(tmpdir) / "prompts"
+        class SimpleSchema(BaseModel):
+            value: str
+
+        client = MockLLMClient(default_response={"value": "before"})
+        assert client.generate("same prompt", SimpleSchema).parsed.value == "before"
+
+        client.default_response = {"value": "after"}
+        assert client.generate("same prompt", SimpleSchema).parsed.value == "after"
+
+    def test_mock_client_fast_mode_batch_generate(self):
+        """MockLLMClient in fast mode should return a response for every prompt."""
+
+        class SimpleSchema(BaseModel):
+            value: str
+
+        client = MockLLMClient(fast_mode=True)
+
+        prompts = ["prompt 1", "prompt 2", "prompt 3"]
+        schemas = [SimpleSchema] * 3
+
+        responses = client.batch_generate(prompts, schemas)
+
+        assert len(responses) == 3
+        assert all(isinstance(r.parsed, SimpleSchema) for r in responses)
+        assert client.get_call_count() == 3
 
-            # Check all Python files are valid
-            for py_file in prompts_dir.rglob("*.py"):
-                try:
-                    source = py_file.read_text()
-                    ast.parse(source)
-                except SyntaxError as e:
-                    assert False, f"Invalid Python in {py_file}: {e}"
+    def test_mock_client_fast_mode_matches_validated_stage_schemas(self, content, factory):
+        """Fast-mode responses on real Stage 2/3 schemas should be fully typed."""
+        category = content.get_all_category_names()[0]
+        element = content.get_all_element_names(category)[0]
+        stage2_schema = factory.get_stage2_schema(category)
+        stage3_schema = factory.get_stage3_schema(category, element)
+
+        fast = MockLLMClient(fast_mode=True)
+        validated = MockLLMClient()
+
+        for schema in (stage2_schema, stage3_schema):
+            for prompt in ("prompt 1", "prompt 2"):
+                parsed = fast.generate(prompt, schema).parsed
+                assert isinstance(parsed, schema)
+                assert parsed == validated.generate(prompt, schema).parsed
+
+        stage3 = fast.generate("prompt 3", stage3_schema).parsed
+        assert isinstance(stage3.element_sentiment, SentimentType)
+
+
+class TestPromptExporter:
+    """Test prompt exporter functionality."""
+
+    def test_exporter_exports_prompts(self, exported_prompts):
+        """PromptExporter should export prompt files."""
+        result, output_dir = exported_prompts
+
+        assert result["files_created"] > 0
+
+        prompts_dir = output_dir / "prompts"
+        assert prompts_dir.exists()
+
+        # Check stage1 directory
+        stage1_dir = prompts_dir / "stage1"
+        assert stage1_dir.exists()
+
+    def test_exporter_creates_valid_python(self, exported_prompts):
+        """PromptExporter should create valid Python files."""
+        _, output_dir = exported_prompts
+        prompts_dir = output_dir / "prompts"
+
+        def check(py_file: Path):
+            # Byte-compile instead of building an AST; the .pyc is reused on import
+            try:
+                py_compile.compile(str(py_file), doraise=True)
+            except py_compile.PyCompileError as e:
+                return py_file, e
+            return None
+
+        # Check all Python files are valid
+        with ThreadPoolExecutor() as executor:
+            errors = [r for r in executor.map(check, prompts_dir.rglob("*.py")) if r]
+
+        assert not errors, f"Invalid Python in {errors}"
 
 
 class TestArtifacts:
@@ -456,8 +618,6 @@ class TestArtifacts:
 
     def test_scaffold_creates_structure(self):
         """scaffold_artifacts should create folder structure."""
-        from classifier import scaffold_artifacts
-
         # Create a minimal schema
         schema = {
             "name": "Test",
@@ -476,21 +636,37 @@ class TestArtifacts:
             schema_path = Path(tmpdir) / "schema.json"
             artifacts_dir = Path(tmpdir) / "artifacts"
 
-            with open(schema_path, "w") as f:
-                json.dump(schema, f)
+            schema_path.write_text(json.dumps(schema), encoding="utf-8")
 
             result = scaffold_artifacts(str(schema_path), str(artifacts_dir))
 
             assert artifacts_dir.exists()
             # Check for category folder
-            category_folders = list(artifacts_dir.glob("*/"))
-            assert len([f for f in category_folders if not f.name.startswith("_")]) > 0
+            with os.scandir(artifacts_dir) as entries:
+                category_count = sum(
+                    1
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False) and not entry.name.startswith("_")
+                )
+            assert category_count > 0
+
+
+def _run_one(test_class, method_name: str):
+    """Run a single test method, returning (status, message, error)."""
+    method = getattr(test_class(), method_name)
+
+    try:
+        fixtures = {name: _FIXTURES[name]() for name in inspect.signature(method).parameters}
+        method(**fixtures)
+        return "✓", "", None
+    except AssertionError as e:
+        return "✗", f": {e}", str(e)
+    except Exception as e:
+        return "✗", f": {type(e).__name__}: {e}", traceback.format_exc()
 
 
 def run_tests():
     """Run all tests and print results."""
-    import traceback
-
     test_classes = [
         TestContentProviders,
         TestSchemaFactory,
@@ -503,40 +679,45 @@ def run_tests():
         TestArtifacts,
     ]
 
-    total = 0
-    passed = 0
-    failed = 0
+    # Build shared fixtures and their schema caches up front so worker
+    # threads only read them
+    for get_fixture in _FIXTURES.values():
+        get_fixture()
+    factory = _get_factory()
+    factory.get_stage1_schema()
+    factory.get_all_stage2_schemas()
+    factory.get_all_stage3_schemas()
+
+    # Only methods defined on the class itself, in definition order
+    tests = [
+        (test_class, method_name)
+        for test_class in test_classes
+        for method_name, attr in vars(test_class).items()
+        if method_name.startswith("test_") and callable(attr)
+    ]
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(lambda test: _run_one(*test), tests))
+
+    total = len(results)
+    failed = sum(error is not None for _, _, error in results)
+    passed = total - failed
     errors = []
 
     print("=" * 60)
     print("RUNNING UNIT TESTS")
     print("=" * 60)
 
-    for test_class in test_classes:
-        print(f"\n{test_class.__name__}")
-        print("-" * 40)
-
-        instance = test_class()
+    current_class = None
+    for (test_class, method_name), (status, message, error) in zip(tests, results):
+        if test_class is not current_class:
+            current_class = test_class
+            print(f"\n{test_class.__name__}")
+            print("-" * 40)
 
-        for method_name in dir(instance):
-            if not method_name.startswith("test_"):
-                continue
-
-            total += 1
-            method = getattr(instance, method_name)
-
-            try:
-                method()
-                print(f"  ✓ {method_name}")
-                passed += 1
-            except AssertionError as e:
-                print(f"  ✗ {method_name}: {e}")
-                failed += 1
-                errors.append((test_class.__name__, method_name, str(e)))
-            except Exception as e:
-                print(f"  ✗ {method_name}: {type(e).__name__}: {e}")
-                failed += 1
-                errors.append((test_class.__name__, method_name, traceback.format_exc()))
+        print(f"  {status} {method_name}{message}")
+        if error is not None:
+            errors.append((test_class.__name__, method_name, error))
 
     print()
     print("=" * 60)
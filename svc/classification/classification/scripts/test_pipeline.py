@@ -46,13 +46,104 @@ Workflow:
 """
 
 import argparse
-from datetime import datetime
+from collections import Counter
+import csv
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+import gc
+import hashlib
 import importlib.util
+from itertools import chain
 import json
 import os
 from pathlib import Path
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used instead
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # optional speedup; the pandas CSV reader is used instead
+    pa = pa_csv = None
+
+# pandas' default NA strings (read_csv/read_excel na_values), for readers
+# that don't apply them on their own
+PANDAS_NA_VALUES = (
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+)
+
+# Pipeline stage names in run order; the first N are run for --stages N
+STAGE_NAMES = ("category_detection", "element_extraction", "attribute_extraction")
+
+
+def read_excel(filepath: Path, sheet_name: str = None, **kwargs) -> pd.DataFrame:
+    """Read an Excel sheet, preferring the native calamine engine when installed."""
+    try:
+        return pd.read_excel(
+            filepath, sheet_name=sheet_name or 0, engine="calamine", **kwargs
+        )
+    except ImportError:
+        # python-calamine not installed - fall back to the default engine
+        return pd.read_excel(filepath, sheet_name=sheet_name or 0, **kwargs)
+
+
+def _check_comment_column(columns, comment_column: str) -> None:
+    """Raise a helpful error if the comment column is missing."""
+    if comment_column not in columns:
+        raise ValueError(f"Column '{comment_column}' not found. Available: {columns.tolist()}")
+
+
+def read_excel_comments(
+    filepath: Path,
+    comment_column: str,
+    sheet_name: Optional[str] = None,
+    max_comments: Optional[int] = None,
+) -> List[str]:
+    """
+    Read the non-empty comments from an Excel sheet, up to max_comments.
+
+    With max_comments, only the leading 2 * max_comments rows are parsed
+    first (headroom for blanks); the column is read in full only if that
+    leaves too few comments and the sheet has more rows. Parsing goes through
+    pandas, so NA strings ("N/A", "None", ...) are dropped exactly as in a
+    full read.
+    """
+    if max_comments:
+        nrows = 2 * max_comments
+        df = read_excel(filepath, sheet_name, usecols=[comment_column], nrows=nrows)
+        comments = df[comment_column].dropna().astype(str).tolist()
+        if len(comments) >= max_comments or len(df) < nrows:
+            return comments[:max_comments]
+
+    df = read_excel(filepath, sheet_name, usecols=[comment_column])
+    return df[comment_column].dropna().astype(str).tolist()[:max_comments]
 
 
 def load_comments_from_file(
@@ -62,21 +153,56 @@ def load_comments_from_file(
     max_comments: int = None,
 ) -> List[str]:
     """Load comments from Excel or CSV file."""
-    import pandas as pd
-
     filepath = Path(filepath)
 
     if filepath.suffix in (".xlsx", ".xls"):
-        df = pd.read_excel(filepath, sheet_name=sheet_name or 0)
+        try:
+            return read_excel_comments(filepath, comment_column, sheet_name, max_comments)
+        except ValueError:
+            # Missing column - re-read just the header for a helpful error
+            header = read_excel(filepath, sheet_name, nrows=0)
+            _check_comment_column(header.columns, comment_column)
+            raise
     elif filepath.suffix == ".csv":
-        df = pd.read_csv(filepath, encoding="utf-8")
+        # Check the header before parsing any rows
+        header = pd.read_csv(filepath, encoding="utf-8", nrows=0)
+        _check_comment_column(header.columns, comment_column)
+
+        if max_comments:
+            # Stop reading once enough non-empty comments are collected
+            comments = []
+            chunks = pd.read_csv(
+                filepath,
+                encoding="utf-8",
+                usecols=[comment_column],
+                chunksize=max(1024, max_comments),
+            )
+            for chunk in chunks:
+                comments.extend(chunk[comment_column].dropna().astype(str).tolist())
+                if len(comments) >= max_comments:
+                    break
+            return comments[:max_comments]
+
+        if pa_csv is not None:
+            # Parse only the comment column with Arrow's multithreaded reader,
+            # as strings and with pandas' NA markers so both readers agree
+            table = pa_csv.read_csv(
+                filepath,
+                # Free-text comments can span lines inside quotes
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=[comment_column],
+                    column_types={comment_column: pa.string()},
+                    null_values=list(PANDAS_NA_VALUES),
+                    strings_can_be_null=True,
+                ),
+            )
+            return [str(c) for c in table.column(comment_column).to_pylist() if c is not None]
+
+        df = pd.read_csv(filepath, encoding="utf-8", usecols=[comment_column])
     else:
         raise ValueError(f"Unsupported file type: {filepath.suffix}")
 
-    if comment_column not in df.columns:
-        available = list(df.columns)
-        raise ValueError(f"Column '{comment_column}' not found. Available: {available}")
-
     comments = df[comment_column].dropna().astype(str).tolist()
 
     if max_comments:
@@ -91,6 +217,100 @@ def load_taxonomy(taxonomy_path: Path) -> dict:
         return json.load(f)
 
 
+VALIDATION_CACHE_FILE = ".validation_cache.json"
+
+
+def _validation_cache_key(taxonomy_path: Path, artifacts_dir: Path) -> List[Any]:
+    """
+    Build a cheap staleness key from file metadata (no file contents are read).
+
+    Covers the taxonomy's size and mtime plus a digest of every artifact
+    YAML's relative path, size and mtime, so renamed, moved, added, removed
+    or swapped files all change the key.
+    """
+    artifacts_dir = Path(artifacts_dir)
+    taxonomy_stat = Path(taxonomy_path).stat()
+
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(artifacts_dir.rglob("*.yaml")):
+        stat = path.stat()
+        rel = path.relative_to(artifacts_dir).as_posix()
+        digest.update(f"{rel}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+
+    return [taxonomy_stat.st_size, taxonomy_stat.st_mtime_ns, digest.hexdigest()]
+
+
+def load_validation_cache(artifacts_dir: Path, key: List[Any]) -> Optional[Dict[str, Any]]:
+    """Return the cached validation result if it is valid and its key still matches."""
+    cache_path = Path(artifacts_dir) / VALIDATION_CACHE_FILE
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+
+    validation = cached.get("result")
+    if not isinstance(validation, dict) or not validation.get("is_valid", True):
+        return None
+    return validation
+
+
+def save_validation_cache(artifacts_dir: Path, key: List[Any], validation: Any) -> None:
+    """Persist a validation result atomically (write to a temp file, then rename)."""
+    cache_path = Path(artifacts_dir) / VALIDATION_CACHE_FILE
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        write_json(tmp_path, {"key": key, "result": validation})
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_prompt_module(name: str, path: Path):
+    """
+    Import an exported Python prompt file as a module.
+
+    The file loader reuses (and refreshes) the bytecode in the file's
+    __pycache__, which the exporter pre-populates with precompile=True.
+    """
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_prompt_modules(named_paths: List[Tuple[str, Path]]) -> List[Any]:
+    """Import several prompt files concurrently, returning modules in input order."""
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(lambda item: load_prompt_module(*item), named_paths))
+
+
+def collect_prompt_files(prompts_dir: Path) -> Dict[str, List[Any]]:
+    """
+    Find every exported prompt file in a single walk of the prompts directory.
+
+    Returns:
+        Dict with "stage1" and "stage2" lists of paths and a "stage3" list of
+        (category_dir_name, path) pairs.
+    """
+    buckets: Dict[str, List[Any]] = {"stage1": [], "stage2": [], "stage3": []}
+
+    for path in prompts_dir.rglob("*.py"):
+        if path.name == "__init__.py":
+            continue
+
+        parts = path.relative_to(prompts_dir).parts
+        if len(parts) == 2 and parts[0] in ("stage1", "stage2"):
+            buckets[parts[0]].append(path)
+        elif len(parts) == 3 and parts[0] == "stage3":
+            buckets["stage3"].append((parts[1], path))
+
+    return buckets
+
+
 def print_header(title: str, char: str = "=", width: int = 70):
     """Print a formatted header."""
     print(f"\n{char * width}")
@@ -98,106 +318,246 @@ def print_header(title: str, char: str = "=", width: int = 70):
     print(char * width)
 
 
+def print_lines(lines: Iterable[str]) -> None:
+    """Print several lines with a single write."""
+    text = "\n".join(lines)
+    if text:
+        sys.stdout.write(text + "\n")
+
+
 def print_step(step_num: int, title: str):
     """Print a step header."""
     print_header(f"STEP {step_num}: {title}")
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode Pydantic models that are handed to the JSON writer as-is."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(
+            orjson.dumps(
+                data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        )
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+
+
 def save_results(
     results: Dict[str, Any],
-    flat_records: List[Dict],
+    flat_records: Iterable[Dict],
     output_dir: Path,
     stages: int,
-):
-    """Save classification results to files."""
-    import pandas as pd
+    timestamp: Optional[str] = None,
+) -> Tuple[Optional[Path], Path, Dict[str, Any]]:
+    """
+    Save classification results and compute their statistics in one pass.
+
+    Flat records are written to the CSV as they are consumed and tallied on
+    the way, so flat_records can be a generator (ResultMerger.iter_flat_records)
+    and is never held in memory as a whole.
+
+    Args:
+        results: Merged classification results keyed by text
+        flat_records: Flat records for the CSV (any iterable)
+        output_dir: Directory to write the result files to
+        stages: Number of stages run (used in the file names)
+        timestamp: Suffix for the output file names (YYYYmmdd_HHMMSS).
+            Defaults to the current local time.
+
+    Returns:
+        (csv_path, json_path, stats) - csv_path is None when there are no
+        flat records.
+    """
+    from classifier.pipeline import ResultMerger
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    # Save CSV
-    if flat_records:
-        df = pd.DataFrame(flat_records)
+    timestamp = timestamp or time.strftime("%Y%m%d_%H%M%S")
+
+    categories = Counter()
+    elements = Counter()
+    sentiments = Counter()
+    total = 0
+
+    # Save CSV (only created when there is at least one record)
+    csv_path = None
+    records = iter(flat_records)
+    first = next(records, None)
+    if first is not None:
         csv_path = output_dir / f"classification_results_{stages}stage_{timestamp}.csv"
-        df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-        print(f"✓ Saved CSV: {csv_path}")
-
-    # Save JSON (full results)
-    json_results = []
-    for text, result in results.items():
-        json_results.append(
-            {
-                "text": text,
-                "categories": [cat.model_dump() for cat in result.categories]
-                if hasattr(result, "categories")
-                else result,
-            }
-        )
+        fields = ResultMerger.FLAT_RECORD_FIELDS
+        with open(csv_path, "w", encoding="utf-8-sig", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(fields)
+
+            for record in chain((first,), records):
+                writer.writerow([record.get(field) for field in fields])
+
+                total += 1
+                if record["category"]:
+                    categories[record["category"]] += 1
+                if record["element"]:
+                    elements[record["element"]] += 1
+                sentiment = record.get("element_sentiment") or record.get("attribute_sentiment")
+                if sentiment:
+                    sentiments[sentiment] += 1
+
+        print(f"✓ Saved CSV: {csv_path} ({total} records)")
+
+    # Save JSON (full results); models are serialized lazily by _json_default
+    json_results = [
+        {
+            "text": text,
+            "categories": result.categories if hasattr(result, "categories") else result,
+        }
+        for text, result in results.items()
+    ]
 
     json_path = output_dir / f"classification_results_{stages}stage_{timestamp}.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(json_results, f, indent=2, ensure_ascii=False)
+    write_json(json_path, json_results)
     print(f"✓ Saved JSON: {json_path}")
 
-    return csv_path, json_path
-
-
-def compute_stats(
-    results: Dict[str, Any],
-    flat_records: List[Dict],
-) -> Dict[str, Any]:
-    """Compute classification statistics."""
     stats = {
         "total_texts": len(results),
-        "total_classifications": len(flat_records),
-        "category_distribution": {},
-        "element_distribution": {},
-        "sentiment_distribution": {},
+        "total_classifications": total,
+        "category_distribution": categories,
+        "element_distribution": elements,
+        "sentiment_distribution": sentiments,
     }
-
-    for record in flat_records:
-        cat = record.get("category")
-        elem = record.get("element")
-        sentiment = record.get("element_sentiment") or record.get("attribute_sentiment")
-
-        if cat:
-            stats["category_distribution"][cat] = stats["category_distribution"].get(cat, 0) + 1
-        if elem:
-            stats["element_distribution"][elem] = stats["element_distribution"].get(elem, 0) + 1
-        if sentiment:
-            stats["sentiment_distribution"][sentiment] = (
-                stats["sentiment_distribution"].get(sentiment, 0) + 1
-            )
-
-    return stats
+    return csv_path, json_path, stats
 
 
-def print_stats(stats: Dict[str, Any]):
+def print_stats(stats: Dict[str, Any], verbose: bool = True):
     """Print classification statistics."""
     print(f"\nTotal texts processed: {stats['total_texts']}")
     print(f"Total classifications: {stats['total_classifications']}")
 
-    if stats["category_distribution"]:
-        print("\nCategory distribution:")
-        for cat, count in sorted(stats["category_distribution"].items(), key=lambda x: -x[1]):
-            pct = (
-                100 * count / stats["total_classifications"]
-                if stats["total_classifications"] > 0
-                else 0
-            )
-            print(f"  {cat}: {count} ({pct:.1f}%)")
-
-    if stats["sentiment_distribution"]:
-        print("\nSentiment distribution:")
-        for sentiment, count in sorted(
-            stats["sentiment_distribution"].items(), key=lambda x: -x[1]
-        ):
-            pct = (
-                100 * count / stats["total_classifications"]
-                if stats["total_classifications"] > 0
-                else 0
-            )
-            print(f"  {sentiment}: {count} ({pct:.1f}%)")
+    if not verbose:
+        # Totals only - the full distributions are in the saved stats JSON
+        return
+
+    total = stats["total_classifications"] or 1
+
+    for title, distribution in (
+        ("Category distribution", stats["category_distribution"]),
+        ("Sentiment distribution", stats["sentiment_distribution"]),
+    ):
+        if not distribution:
+            continue
+
+        lines = [f"\n{title}:"]
+        lines.extend(
+            f"  {name}: {count} ({100 * count / total:.1f}%)"
+            for name, count in distribution.most_common()
+        )
+        print_lines(lines)
+
+
+def release_gpu_memory() -> None:
+    """Drop cached CUDA allocations so the next model load sees free GPU memory."""
+    gc.collect()
+    try:
+        import torch
+    except ImportError:
+        return
+    # Only touch CUDA if this process already uses it - calling these would
+    # otherwise create a CUDA context here, on the GPU vLLM is about to load on
+    if torch.cuda.is_available() and torch.cuda.is_initialized():
+        torch.cuda.empty_cache()
+        torch.cuda.ipc_collect()
+
+
+@lru_cache(maxsize=1)
+def _vllm_client_factory():
+    """
+    Resolve VLLMClientFactory once, or None if vLLM is not available.
+
+    A failed import is not cached by Python, so without this every call
+    would search for the missing modules again.
+    """
+    try:
+        from classifier.infrastructure.llm import VLLMClientFactory
+    except ImportError:
+        return None
+    return VLLMClientFactory
+
+
+def create_llm(
+    use_mock_llm: bool, gpu_list: List[int], model: str, batch_size: int
+) -> Tuple[Any, str]:
+    """
+    Create the classification LLM client.
+
+    Falls back to MockLLMClient when vLLM is not available.
+
+    Returns:
+        (llm, status) - the client and a status line to print
+    """
+    from classifier import MockLLMClient
+
+    if use_mock_llm:
+        return MockLLMClient(), "✓ Using MockLLMClient (for testing)"
+
+    factory = _vllm_client_factory()
+    if factory is None:
+        return MockLLMClient(), "⚠ VLLMClient not available, falling back to MockLLMClient"
+
+    try:
+        llm = factory.create(
+            gpu_list=gpu_list,
+            model=model,
+            batch_size=batch_size,
+        )
+    except ImportError:
+        # create() imports NewProcessor lazily, so this can still fail here
+        return MockLLMClient(), "⚠ VLLMClient not available, falling back to MockLLMClient"
+    return llm, f"✓ Using VLLMClient with {model} on GPU {gpu_list}"
+
+
+def prefetch_llm(
+    use_mock_llm: bool, gpu_list: List[int], model: str, batch_size: int
+) -> Tuple[Future, Callable[[], None]]:
+    """
+    Start create_llm() in a background thread.
+
+    Loading model weights is the slowest part of startup, so it runs while
+    content, schemas and prompts are prepared.
+
+    Returns:
+        (future, abandon) - call .result() on the future to get (llm, status).
+        If a step fails before then, call abandon(): a load that hasn't
+        started is cancelled, and one in progress frees the client and its
+        GPU memory as soon as it finishes instead of holding them.
+    """
+    abandoned = threading.Event()
+
+    def load() -> Optional[Tuple[Any, str]]:
+        result = create_llm(use_mock_llm, gpu_list, model, batch_size)
+        if abandoned.is_set():
+            del result
+            release_gpu_memory()
+            return None
+        return result
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(load)
+    executor.shutdown(wait=False)
+
+    def abandon() -> None:
+        abandoned.set()
+        future.cancel()
+
+    return future, abandon
 
 
 # =============================================================================
@@ -234,18 +594,8 @@ def run_full_pipeline(
     - Handcrafted: Battle-tested Stage 1 & 2 examples/rules
     - YAML: Generated content for Stage 3 and any gaps
     """
-    from classifier import (
-        HandcraftedContentProvider,
-        PipelineBuilder,
-        PromptExporter,
-        ResultMerger,
-        TaxonomySchemaFactory,
-        YAMLContentProvider,
-        generate_artifact_content,
-        scaffold_artifacts,
-        validate_artifacts,
-    )
-    from classifier.content import CompositeContentProvider
+    # Each step imports what it needs, so skipped steps don't load their modules
+    from classifier import scaffold_artifacts, validate_artifacts
 
     # =========================================================================
     # STEP 1: Scaffold Artifacts
@@ -263,13 +613,19 @@ def run_full_pipeline(
             print(f"  Files created: {result.get('files_created', 'N/A')}")
     else:
         print(f"✓ Artifacts directory exists: {artifacts_dir}")
-        # Validate existing artifacts
+        # Validate existing artifacts (skipped when nothing changed since a valid run)
         try:
-            validation = validate_artifacts(
-                artifacts_dir=str(artifacts_dir),
-                schema_path=str(taxonomy_path),
-                verbose=False,
-            )
+            cache_key = _validation_cache_key(taxonomy_path, artifacts_dir)
+            validation = load_validation_cache(artifacts_dir, cache_key)
+            if validation is not None:
+                print("✓ Artifacts unchanged since last validation - skipping")
+            else:
+                validation = validate_artifacts(
+                    artifacts_dir=str(artifacts_dir),
+                    schema_path=str(taxonomy_path),
+                    verbose=False,
+                )
+                save_validation_cache(artifacts_dir, cache_key, validation)
             if isinstance(validation, dict) and not validation.get("is_valid", True):
                 print(f"⚠ Validation issues: {len(validation.get('errors', []))} errors")
                 for err in validation.get("errors", [])[:5]:
@@ -287,6 +643,10 @@ def run_full_pipeline(
             print("⚠ Using MockLLMClient - content generation skipped")
             print("  (Use real LLM for actual content generation)")
         else:
+            # Outside the try: a broken classifier import is not a missing
+            # llm_parallelization
+            from classifier import generate_artifact_content
+
             try:
                 from llm_parallelization.new_processor import NewProcessor
 
@@ -305,6 +665,8 @@ def run_full_pipeline(
                         generate_attribute_content=not skip_attribute_content,
                         verbose=verbose,
                     )
+                del processor
+                release_gpu_memory()
                 if isinstance(stats, dict):
                     print(
                         f"✓ Generated: {stats.get('descriptions', 0)} descriptions, "
@@ -317,107 +679,115 @@ def run_full_pipeline(
     else:
         print_step(2, "SKIP GENERATION (--skip-generation)")
 
-    # =========================================================================
-    # STEP 3: Load Content from YAML + Handcrafted
-    # =========================================================================
-    print_step(3, "LOAD CONTENT (HANDCRAFTED + YAML)")
-
-    # Load YAML content (generated/scaffolded)
-    yaml_content = YAMLContentProvider(str(artifacts_dir), verbose=verbose)
-
-    # Load handcrafted content (battle-tested examples/rules)
-    handcrafted_content = HandcraftedContentProvider()
-
-    # Combine: Handcrafted has priority, YAML fills gaps
-    # - Categories/Elements/Attributes: First provider with content wins
-    # - Examples/Rules: MERGED from all providers (deduplicated)
-    content = CompositeContentProvider(
-        [
-            handcrafted_content,  # Priority: battle-tested Stage 1 & 2 content
-            yaml_content,  # Fallback: generated content, Stage 3
-        ]
-    )
-
-    categories = content.get_all_category_names()
-    print(f"✓ Loaded {len(categories)} categories")
-    for cat in categories:
-        elements = content.get_all_element_names(cat)
-        print(f"  {cat}: {len(elements)} elements")
-
-    # Show example/rule counts from merged content
-    stage1_examples = content.get_examples("stage1")
-    stage1_rules = content.get_rules("stage1")
-    print(f"✓ Stage 1: {len(stage1_examples)} examples, {len(stage1_rules)} rules")
-
-    # Show breakdown of sources
-    handcrafted_s1_examples = handcrafted_content.get_examples("stage1")
-    yaml_s1_examples = yaml_content.get_examples("stage1")
-    print(f"  (Handcrafted: {len(handcrafted_s1_examples)}, YAML: {len(yaml_s1_examples)})")
-
-    stage2_examples = content.get_examples("stage2")
-    handcrafted_s2_examples = handcrafted_content.get_examples("stage2")
-    yaml_s2_examples = yaml_content.get_examples("stage2")
-    print(f"✓ Stage 2: {len(stage2_examples)} examples")
-    print(f"  (Handcrafted: {len(handcrafted_s2_examples)}, YAML: {len(yaml_s2_examples)})")
-
-    # =========================================================================
-    # STEP 4: Build Schemas
-    # =========================================================================
-    print_step(4, "BUILD SCHEMAS")
-
-    schema_factory = TaxonomySchemaFactory(content)
+    # The GPUs are free once generation is done - start loading the
+    # classification LLM now so it overlaps STEPs 3-5
+    llm_future, abandon_llm = prefetch_llm(use_mock_llm, gpu_list, model, batch_size)
+    try:
 
-    # Build Stage 1 schema
-    stage1_schema = schema_factory.get_stage1_schema()
-    print(f"✓ Stage 1 schema: {stage1_schema.__name__}")
+        # =========================================================================
+        # STEP 3: Load Content from YAML + Handcrafted
+        # =========================================================================
+        print_step(3, "LOAD CONTENT (HANDCRAFTED + YAML)")
 
-    # Build Stage 2 schemas
-    stage2_schemas = schema_factory.get_all_stage2_schemas()
-    print(f"✓ Stage 2 schemas: {len(stage2_schemas)} categories")
+        from classifier import HandcraftedContentProvider, YAMLContentProvider
+        from classifier.content import CompositeContentProvider
 
-    # Build Stage 3 schemas if needed
-    if stages >= 3:
-        stage3_schemas = schema_factory.get_all_stage3_schemas()
-        total_s3 = len(stage3_schemas)
-        print(f"✓ Stage 3 schemas: {total_s3} category/element pairs")
+        # Load YAML content (generated/scaffolded)
+        yaml_content = YAMLContentProvider(str(artifacts_dir), verbose=verbose)
 
-    # =========================================================================
-    # STEP 5: Export Prompts (optional)
-    # =========================================================================
-    if export_prompts_dir:
-        print_step(5, "EXPORT PROMPTS")
+        # Load handcrafted content (battle-tested examples/rules)
+        handcrafted_content = HandcraftedContentProvider()
 
-        exporter = PromptExporter(content, schema_factory)
-        result = exporter.export_prompts(str(export_prompts_dir), verbose=verbose)
-        print(
-            f"✓ Exported {result.get('files_created', 'N/A')} prompt files to {export_prompts_dir}"
+        # Combine: Handcrafted has priority, YAML fills gaps
+        # - Categories/Elements/Attributes: First provider with content wins
+        # - Examples/Rules: MERGED from all providers (deduplicated)
+        content = CompositeContentProvider(
+            [
+                handcrafted_content,  # Priority: battle-tested Stage 1 & 2 content
+                yaml_content,  # Fallback: generated content, Stage 3
+            ]
         )
 
-    # =========================================================================
-    # STEP 6: Build Pipeline
-    # =========================================================================
-    print_step(6, "BUILD PIPELINE")
+        elements_by_category = content.get_all_element_names_by_category()
+        print(f"✓ Loaded {len(elements_by_category)} categories")
+        if verbose:
+            print_lines(
+                f"  {cat}: {len(elements)} elements"
+                for cat, elements in elements_by_category.items()
+            )
 
-    if use_mock_llm:
-        from classifier import MockLLMClient
+        # Show example/rule counts from merged content
+        stage1_examples = content.get_examples("stage1")
+        stage1_rules = content.get_rules("stage1")
+        print(f"✓ Stage 1: {len(stage1_examples)} examples, {len(stage1_rules)} rules")
 
-        llm = MockLLMClient()
-        print("✓ Using MockLLMClient (for testing)")
-    else:
-        try:
-            from classifier.infrastructure.llm import VLLMClientFactory
+        # Show breakdown of sources
+        if verbose:
+            handcrafted_s1_examples = handcrafted_content.get_examples("stage1")
+            yaml_s1_examples = yaml_content.get_examples("stage1")
+            print(f"  (Handcrafted: {len(handcrafted_s1_examples)}, YAML: {len(yaml_s1_examples)})")
 
-            llm = VLLMClientFactory.create(
-                gpu_list=gpu_list,
-                model=model,
-                batch_size=batch_size,
+        stage2_examples = content.get_examples("stage2")
+        print(f"✓ Stage 2: {len(stage2_examples)} examples")
+        if verbose:
+            handcrafted_s2_examples = handcrafted_content.get_examples("stage2")
+            yaml_s2_examples = yaml_content.get_examples("stage2")
+            print(f"  (Handcrafted: {len(handcrafted_s2_examples)}, YAML: {len(yaml_s2_examples)})")
+
+        # =========================================================================
+        # STEP 4: Build Schemas
+        # =========================================================================
+        print_step(4, "BUILD SCHEMAS")
+
+        from classifier import TaxonomySchemaFactory
+
+        schema_factory = TaxonomySchemaFactory(content)
+
+        # Build Stage 1 schema
+        stage1_schema = schema_factory.get_stage1_schema()
+        print(f"✓ Stage 1 schema: {stage1_schema.__name__}")
+
+        # Build Stage 2 schemas
+        stage2_schemas = schema_factory.get_all_stage2_schemas()
+        print(f"✓ Stage 2 schemas: {len(stage2_schemas)} categories")
+
+        # Build Stage 3 schemas if needed
+        if stages >= 3:
+            stage3_schemas = schema_factory.get_all_stage3_schemas()
+            total_s3 = len(stage3_schemas)
+            print(f"✓ Stage 3 schemas: {total_s3} category/element pairs")
+
+        # =========================================================================
+        # STEP 5: Export Prompts (optional)
+        # =========================================================================
+        export_executor = None
+        if export_prompts_dir:
+            print_step(5, "EXPORT PROMPTS")
+
+            from classifier import PromptExporter
+
+            # Export only reads content and schemas, so write the files in the
+            # background while the pipeline (and its LLM) is built in STEP 6
+            exporter = PromptExporter(content, schema_factory)
+            export_executor = ThreadPoolExecutor(max_workers=1)
+            export_future = export_executor.submit(
+                exporter.export_prompts, str(export_prompts_dir), verbose=False, precompile=True
             )
-            print(f"✓ Using VLLMClient with {model} on GPU {gpu_list}")
-        except ImportError:
-            from classifier import MockLLMClient
+            print(f"✓ Exporting prompts to {export_prompts_dir} in the background")
+
+        # =========================================================================
+        # STEP 6: Build Pipeline
+        # =========================================================================
+        print_step(6, "BUILD PIPELINE")
 
-            llm = MockLLMClient()
-            print("⚠ VLLMClient not available, falling back to MockLLMClient")
+        from classifier import PipelineBuilder
+
+        llm, llm_status = llm_future.result()
+    except BaseException:
+        # Nothing will use the prefetched client - free it instead of holding the GPU
+        abandon_llm()
+        raise
+    print(llm_status)
 
     pipeline = (
         PipelineBuilder()
@@ -429,6 +799,13 @@ def run_full_pipeline(
     )
     print(f"✓ Pipeline ready ({stages}-stage)")
 
+    if export_executor is not None:
+        result = export_future.result()
+        export_executor.shutdown()
+        print(
+            f"✓ Exported {result.get('files_created', 'N/A')} prompt files to {export_prompts_dir}"
+        )
+
     # =========================================================================
     # STEP 7: Run Classification
     # =========================================================================
@@ -455,11 +832,7 @@ def run_full_pipeline(
     print(f"✓ Loaded {len(comments)} comments from {input_file}")
 
     # Determine which stages to run
-    stage_names = ["category_detection"]
-    if stages >= 2:
-        stage_names.append("element_extraction")
-    if stages >= 3:
-        stage_names.append("attribute_extraction")
+    stage_names = list(STAGE_NAMES[:stages])
 
     print(f"Running stages: {' → '.join(stage_names)}")
 
@@ -471,33 +844,35 @@ def run_full_pipeline(
     # =========================================================================
     print_step(8, "MERGE RESULTS")
 
+    from classifier import ResultMerger
+
     merger = ResultMerger()
     final_results = merger.merge(context)
-    flat_records = merger.to_flat_records(final_results)
 
     print(f"✓ Merged {len(final_results)} results")
-    print(f"✓ Created {len(flat_records)} flat records")
 
     # =========================================================================
     # STEP 9: Save Results
     # =========================================================================
     print_step(9, "SAVE RESULTS")
 
+    # Flat records are streamed straight to the CSV while stats are tallied
     output_dir = artifacts_dir.parent / "output"
-    csv_path, json_path = save_results(final_results, flat_records, output_dir, stages)
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    csv_path, json_path, stats = save_results(
+        final_results, merger.iter_flat_records(final_results), output_dir, stages, timestamp
+    )
 
-    # Compute and save stats
-    stats = compute_stats(final_results, flat_records)
+    # Save stats
     stats_path = output_dir / f"classification_stats_{stages}stage.json"
-    with open(stats_path, "w", encoding="utf-8") as f:
-        json.dump(stats, f, indent=2)
+    write_json(stats_path, stats)
     print(f"✓ Saved stats: {stats_path}")
 
     # =========================================================================
     # SUMMARY
     # =========================================================================
     print_header("🔥 PIPELINE COMPLETE! 🔥")
-    print_stats(stats)
+    print_stats(stats, verbose=verbose)
     print(f"\nArtifacts: {artifacts_dir}")
     if export_prompts_dir:
         print(f"Prompts: {export_prompts_dir}")
@@ -529,217 +904,219 @@ def run_from_python_prompts(
     if not prompts_dir.exists():
         raise FileNotFoundError(f"Prompts directory not found: {prompts_dir}")
 
-    # =========================================================================
-    # STEP 1: Load Stage 1 prompt module
-    # =========================================================================
-    print_step(1, "LOAD STAGE 1 PROMPT")
+    # Check every stage directory up front - a missing one must fail before
+    # the model load starts, not leave it running in the background
+    for stage_num in range(1, stages + 1):
+        stage_dir = prompts_dir / f"stage{stage_num}"
+        if not stage_dir.exists():
+            raise FileNotFoundError(f"Stage {stage_num} directory not found: {stage_dir}")
 
-    stage1_dir = prompts_dir / "stage1"
-    if not stage1_dir.exists():
-        raise FileNotFoundError(f"Stage 1 directory not found: {stage1_dir}")
+    prompt_files = collect_prompt_files(prompts_dir)
 
-    stage1_files = [f for f in stage1_dir.glob("*.py") if f.name != "__init__.py"]
+    stage1_files = prompt_files["stage1"]
     if not stage1_files:
-        raise FileNotFoundError(f"No Stage 1 prompt file found in {stage1_dir}")
-
-    stage1_path = stage1_files[0]
-    spec = importlib.util.spec_from_file_location("stage1_module", stage1_path)
-    stage1_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(stage1_module)
+        raise FileNotFoundError(f"No Stage 1 prompt file found in {prompts_dir / 'stage1'}")
 
-    # Get categories and prompt builder
-    categories = getattr(stage1_module, "CATEGORIES", {})
-    build_stage1_prompt = getattr(stage1_module, "build_stage1_prompt", None)
-
-    print(f"✓ Loaded Stage 1 from {stage1_path.name}")
-    print(f"  Categories: {list(categories.keys())}")
-
-    # =========================================================================
-    # STEP 2: Load Stage 2 prompt modules
-    # =========================================================================
-    stage2_modules = {}
-    if stages >= 2:
-        print_step(2, "LOAD STAGE 2 PROMPTS")
-
-        stage2_dir = prompts_dir / "stage2"
-        if not stage2_dir.exists():
-            raise FileNotFoundError(f"Stage 2 directory not found: {stage2_dir}")
+    # Load the LLM while the prompt modules are imported
+    llm_future, abandon_llm = prefetch_llm(use_mock_llm, gpu_list, model, batch_size)
+    try:
 
-        for category_file in stage2_dir.glob("*.py"):
-            if category_file.name == "__init__.py":
-                continue
+        # =========================================================================
+        # STEP 1: Load Stage 1 prompt module
+        # =========================================================================
+        print_step(1, "LOAD STAGE 1 PROMPT")
 
-            category_name = category_file.stem
-            spec = importlib.util.spec_from_file_location(
-                f"stage2_{category_name}", category_file
-            )
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+        stage1_path = stage1_files[0]
+        stage1_module = load_prompt_module("stage1_module", stage1_path)
 
-            stage2_modules[category_name] = {
-                "module": module,
-                "elements": getattr(module, "ELEMENTS", {}),
-                "build_prompt": getattr(module, "build_stage2_prompt", None),
-            }
+        # Get categories and prompt builder
+        categories = getattr(stage1_module, "CATEGORIES", {})
+        build_stage1_prompt = getattr(stage1_module, "build_stage1_prompt", None)
 
-        print(f"✓ Loaded {len(stage2_modules)} Stage 2 prompts")
-        for name, data in stage2_modules.items():
-            print(f"  {name}: {len(data['elements'])} elements")
+        print(f"✓ Loaded Stage 1 from {stage1_path.name}")
+        print(f"  Categories: {list(categories.keys())}")
 
-    # =========================================================================
-    # STEP 3: Load Stage 3 prompt modules
-    # =========================================================================
-    stage3_modules = {}
-    if stages >= 3:
-        print_step(3, "LOAD STAGE 3 PROMPTS")
+        # =========================================================================
+        # STEP 2: Load Stage 2 prompt modules
+        # =========================================================================
+        stage2_modules = {}
+        if stages >= 2:
+            print_step(2, "LOAD STAGE 2 PROMPTS")
 
-        stage3_dir = prompts_dir / "stage3"
-        if not stage3_dir.exists():
-            raise FileNotFoundError(f"Stage 3 directory not found: {stage3_dir}")
+            category_files = prompt_files["stage2"]
+            modules = load_prompt_modules([(f"stage2_{f.stem}", f) for f in category_files])
 
-        for category_dir in stage3_dir.iterdir():
-            if not category_dir.is_dir():
-                continue
+            for category_file, module in zip(category_files, modules):
+                category_name = category_file.stem
+                stage2_modules[category_name] = {
+                    "module": module,
+                    "elements": getattr(module, "ELEMENTS", {}),
+                    "build_prompt": getattr(module, "build_stage2_prompt", None),
+                }
 
-            category_name = category_dir.name
-            stage3_modules[category_name] = {}
+            print(f"✓ Loaded {len(stage2_modules)} Stage 2 prompts")
+            if verbose:
+                print_lines(
+                    f"  {name}: {len(data['elements'])} elements"
+                    for name, data in stage2_modules.items()
+                )
 
-            for element_file in category_dir.glob("*.py"):
-                if element_file.name == "__init__.py":
-                    continue
+        # =========================================================================
+        # STEP 3: Load Stage 3 prompt modules
+        # =========================================================================
+        stage3_modules = {}
+        if stages >= 3:
+            print_step(3, "LOAD STAGE 3 PROMPTS")
 
-                element_name = element_file.stem
-                spec = importlib.util.spec_from_file_location(
-                    f"stage3_{category_name}_{element_name}", element_file
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+            element_files = prompt_files["stage3"]
+            modules = load_prompt_modules(
+                [(f"stage3_{category_name}_{f.stem}", f) for category_name, f in element_files]
+            )
 
-                stage3_modules[category_name][element_name] = {
+            for (category_name, element_file), module in zip(element_files, modules):
+                stage3_modules.setdefault(category_name, {})[element_file.stem] = {
                     "module": module,
                     "attributes": getattr(module, "ATTRIBUTES", {}),
                     "build_prompt": getattr(module, "build_stage3_prompt", None),
                 }
 
-        total_s3 = sum(len(elems) for elems in stage3_modules.values())
-        print(f"✓ Loaded {total_s3} Stage 3 prompts")
-
-    # =========================================================================
-    # STEP 4: Build Custom Content Provider from Python modules
-    # =========================================================================
-    print_step(4, "BUILD CONTENT PROVIDER FROM PYTHON MODULES")
-
-    # Create a simple content provider that wraps the loaded Python modules
-    from classifier.content.interfaces import (
-        AttributeContent,
-        CategoryContent,
-        ContentProvider,
-        ElementContent,
-        Example,
-        Rule,
-    )
-
-    class PythonModuleContentProvider(ContentProvider):
-        """Content provider that loads from exported Python prompt modules."""
-
-        def __init__(self, categories, stage2_modules, stage3_modules):
-            self._categories = categories
-            self._stage2 = stage2_modules
-            self._stage3 = stage3_modules
-
-        def get_categories(self):
-            return [
-                CategoryContent(
-                    name=name,
-                    description=info.get("description", ""),
-                    condensed_description=info.get("description", ""),
-                    keywords=[],
-                    elements=info.get("elements", []),
-                )
-                for name, info in self._categories.items()
-            ]
-
-        def get_elements(self, category):
-            if category not in self._stage2:
-                # Try to find by sanitized name
-                for key, data in self._stage2.items():
-                    if key.lower().replace("_", " ") == category.lower().replace("_", " "):
-                        elements_dict = data.get("elements", {})
-                        break
-                else:
-                    return []
-            else:
-                elements_dict = self._stage2[category].get("elements", {})
-
-            return [
-                ElementContent(
-                    name=name,
-                    category=category,
-                    description=info.get("description", ""),
-                    condensed_description=info.get("description", ""),
-                    keywords=[],
-                    attributes=info.get("attributes", []),
-                )
-                for name, info in elements_dict.items()
-            ]
-
-        def get_attributes(self, category, element):
-            cat_data = self._stage3.get(category, {})
-            elem_data = cat_data.get(element, {})
-            attrs_dict = elem_data.get("attributes", {})
-
-            return [
-                AttributeContent(
-                    name=name,
-                    element=element,
-                    category=category,
-                    description=info.get("description", ""),
-                    condensed_description=info.get("description", ""),
-                )
-                for name, info in attrs_dict.items()
-            ]
-
-        def get_examples(self, stage, category=None, element=None):
-            # Could load from EXAMPLES in modules if needed
-            return []
-
-        def get_rules(self, stage, category=None, element=None):
-            # Could load from RULES in modules if needed
-            return []
+            total_s3 = sum(len(elems) for elems in stage3_modules.values())
+            print(f"✓ Loaded {total_s3} Stage 3 prompts")
+
+        # =========================================================================
+        # STEP 4: Build Custom Content Provider from Python modules
+        # =========================================================================
+        print_step(4, "BUILD CONTENT PROVIDER FROM PYTHON MODULES")
+
+        # Create a simple content provider that wraps the loaded Python modules
+        from classifier.content.interfaces import (
+            AttributeContent,
+            CategoryContent,
+            ContentProvider,
+            ElementContent,
+            Example,
+            Rule,
+        )
 
-    content = PythonModuleContentProvider(categories, stage2_modules, stage3_modules)
-    print("✓ Created content provider from Python modules")
+        class PythonModuleContentProvider(ContentProvider):
+            """Content provider that loads from exported Python prompt modules."""
 
-    # =========================================================================
-    # STEP 5: Build Pipeline
-    # =========================================================================
-    print_step(5, "BUILD PIPELINE")
+            def __init__(self, categories, stage2_modules, stage3_modules):
+                self._categories = categories
+                self._stage2 = stage2_modules
+                self._stage3 = stage3_modules
 
-    from classifier import (
-        MockLLMClient,
-        PipelineBuilder,
-        ResultMerger,
-        TaxonomySchemaFactory,
-    )
+                # Sanitized name -> module key, for names that don't match exactly
+                self._stage2_aliases = {self._normalize(key): key for key in self._stage2}
+                self._stage3_aliases = {self._normalize(key): key for key in self._stage3}
+                self._element_aliases = {
+                    category: {self._normalize(key): key for key in elements}
+                    for category, elements in self._stage3.items()
+                }
 
-    schema_factory = TaxonomySchemaFactory(content)
+                # Content objects are built once and reused across calls, like
+                # YAMLContentProvider's caches
+                self._category_contents = [
+                    CategoryContent(
+                        name=name,
+                        description=info.get("description", ""),
+                        condensed_description=info.get("description", ""),
+                        keywords=[],
+                        elements=info.get("elements", []),
+                    )
+                    for name, info in self._categories.items()
+                ]
+                self._element_contents: Dict[str, List[ElementContent]] = {}
+                self._attribute_contents: Dict[Tuple[str, str], List[AttributeContent]] = {}
+
+            def get_categories(self):
+                return self._category_contents
+
+            def get_elements(self, category):
+                if category in self._element_contents:
+                    return self._element_contents[category]
+
+                key = self._resolve(category, self._stage2, self._stage2_aliases)
+                elements_dict = self._stage2[key].get("elements", {}) if key else {}
+
+                elements = [
+                    ElementContent(
+                        name=name,
+                        category=category,
+                        description=info.get("description", ""),
+                        condensed_description=info.get("description", ""),
+                        keywords=[],
+                        attributes=info.get("attributes", []),
+                    )
+                    for name, info in elements_dict.items()
+                ]
+                self._element_contents[category] = elements
+                return elements
+
+            def get_attributes(self, category, element):
+                cache_key = (category, element)
+                if cache_key in self._attribute_contents:
+                    return self._attribute_contents[cache_key]
+
+                cat_key = self._resolve(category, self._stage3, self._stage3_aliases)
+                cat_data = self._stage3.get(cat_key, {})
+                elem_key = self._resolve(element, cat_data, self._element_aliases.get(cat_key, {}))
+                elem_data = cat_data.get(elem_key, {})
+                attrs_dict = elem_data.get("attributes", {})
+
+                attributes = [
+                    AttributeContent(
+                        name=name,
+                        element=element,
+                        category=category,
+                        description=info.get("description", ""),
+                        condensed_description=info.get("description", ""),
+                    )
+                    for name, info in attrs_dict.items()
+                ]
+                self._attribute_contents[cache_key] = attributes
+                return attributes
+
+            @staticmethod
+            def _normalize(name):
+                return name.lower().replace("_", " ")
+
+            def _resolve(self, name, modules, aliases):
+                """Return the module key for name, trying an exact match first."""
+                if name in modules:
+                    return name
+                return aliases.get(self._normalize(name))
+
+            def get_examples(self, stage, category=None, element=None):
+                # Could load from EXAMPLES in modules if needed
+                return []
+
+            def get_rules(self, stage, category=None, element=None):
+                # Could load from RULES in modules if needed
+                return []
+
+        content = PythonModuleContentProvider(categories, stage2_modules, stage3_modules)
+        print("✓ Created content provider from Python modules")
+
+        # =========================================================================
+        # STEP 5: Build Pipeline
+        # =========================================================================
+        print_step(5, "BUILD PIPELINE")
+
+        from classifier import (
+            PipelineBuilder,
+            ResultMerger,
+            TaxonomySchemaFactory,
+        )
 
-    if use_mock_llm:
-        llm = MockLLMClient()
-        print("✓ Using MockLLMClient (for testing)")
-    else:
-        try:
-            from classifier.infrastructure.llm import VLLMClientFactory
+        schema_factory = TaxonomySchemaFactory(content)
 
-            llm = VLLMClientFactory.create(
-                gpu_list=gpu_list,
-                model=model,
-                batch_size=batch_size,
-            )
-            print(f"✓ Using VLLMClient with {model} on GPU {gpu_list}")
-        except ImportError:
-            llm = MockLLMClient()
-            print("⚠ VLLMClient not available, falling back to MockLLMClient")
+        llm, llm_status = llm_future.result()
+    except BaseException:
+        # Nothing will use the prefetched client - free it instead of holding the GPU
+        abandon_llm()
+        raise
+    print(llm_status)
 
     pipeline = (
         PipelineBuilder()
@@ -770,11 +1147,7 @@ def run_from_python_prompts(
     )
     print(f"✓ Loaded {len(comments)} comments")
 
-    stage_names = ["category_detection"]
-    if stages >= 2:
-        stage_names.append("element_extraction")
-    if stages >= 3:
-        stage_names.append("attribute_extraction")
+    stage_names = list(STAGE_NAMES[:stages])
 
     context = pipeline.run_with_context(comments, stages=stage_names)
 
@@ -785,18 +1158,18 @@ def run_from_python_prompts(
 
     merger = ResultMerger()
     final_results = merger.merge(context)
-    flat_records = merger.to_flat_records(final_results)
 
     output_dir = prompts_dir.parent / "output"
-    csv_path, json_path = save_results(final_results, flat_records, output_dir, stages)
-
-    stats = compute_stats(final_results, flat_records)
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    csv_path, json_path, stats = save_results(
+        final_results, merger.iter_flat_records(final_results), output_dir, stages, timestamp
+    )
 
     # =========================================================================
     # SUMMARY
     # =========================================================================
     print_header("🔥 PIPELINE COMPLETE! 🔥")
-    print_stats(stats)
+    print_stats(stats, verbose=verbose)
     print(f"\nPrompts loaded from: {prompts_dir}")
     print(f"Results: {output_dir}")
 
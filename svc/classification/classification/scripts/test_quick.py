@@ -17,12 +17,24 @@ Usage:
 
     # Test with real comments
     python test_quick.py --input-file comments.xlsx --comment-column "comment"
+
+    # Load once, then classify texts typed at a prompt
+    python test_quick.py --interactive
 """
 
 import argparse
+from collections import Counter
+from functools import lru_cache
 import json
+import os
 from pathlib import Path
 import sys
+from typing import Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used instead
+    orjson = None
 
 # Default paths - update these for your environment
 DEFAULT_SCHEMA = "/data-fast/data3/clyde/projects/world/documents/schemas/schema_v1.json"
@@ -30,49 +42,113 @@ DEFAULT_ARTIFACTS = "./test_artifacts"
 DEFAULT_INPUT = "/data-fast/data3/clyde/projects/world/documents/annotator_files/conference_comments_annotated.xlsx"
 DEFAULT_COLUMN = "comment"
 
+# Pipeline stage names in run order; the first N are run for --stages N
+STAGE_NAMES = ("category_detection", "element_extraction", "attribute_extraction")
 
-def run_quick_test(
-    taxonomy_path: str = None,
-    artifacts_dir: str = None,
-    input_file: str = None,
-    comment_column: str = DEFAULT_COLUMN,
-    max_comments: int = 5,
-    stages: int = 2,
-    use_mock: bool = True,
-    verbose: bool = True,
-):
-    """Run a quick test of the pipeline."""
 
-    # Use defaults if not provided
-    taxonomy_path = taxonomy_path or DEFAULT_SCHEMA
-    artifacts_dir = artifacts_dir or DEFAULT_ARTIFACTS
+def _load_comments(path: str, column: str, limit: int) -> Optional[List[str]]:
+    """
+    Read up to `limit` non-empty comments from an Excel file.
 
-    print("=" * 60)
-    print("QUICK TEST - Classifier Pipeline")
-    print("=" * 60)
-    print(f"Schema: {taxonomy_path}")
-    print(f"Artifacts: {artifacts_dir}")
-    print(f"Stages: {stages}")
-    print(f"Mock LLM: {use_mock}")
-    print()
+    Uses test_pipeline's reader. Returns None if the sheet has no such column.
+    """
+    from test_pipeline import read_excel, read_excel_comments
 
-    # Import classifier components
-    from classifier import (
-        HandcraftedContentProvider,
-        MockLLMClient,
-        PipelineBuilder,
-        PromptExporter,
-        ResultMerger,
-        TaxonomySchemaFactory,
-        YAMLContentProvider,
-        scaffold_artifacts,
-    )
-    from classifier.content import CompositeContentProvider
+    # Check the header first; other read errors propagate as they are
+    if column not in read_excel(Path(path), nrows=0).columns:
+        return None
+    return read_excel_comments(Path(path), column, max_comments=limit)
+
+
+def _silent(*args, **kwargs) -> None:
+    """print() stand-in for progress lines under --quiet."""
+
+
+def _sentiment_value(sentiment):
+    """Plain sentiment string, whether given a SentimentType or a str."""
+    return getattr(sentiment, "value", sentiment)
+
+
+# The one pipeline kept by _build_pipeline(): (key, pipeline, schema_factory)
+_cached_pipeline: Optional[Tuple[tuple, Any, Any]] = None
+
+
+def clear_pipeline_cache() -> None:
+    """
+    Drop the cached pipeline, LLM client and generated schema models.
+
+    Call this after editing the artifacts or taxonomy in a long-lived process
+    (e.g. a notebook) so the next run reloads them.
+    """
+    from classifier.schemas import clear_schema_cache
+
+    global _cached_pipeline
+    _cached_pipeline = None
+    _create_llm.cache_clear()
+    clear_schema_cache()
+
+
+@lru_cache(maxsize=1)
+def _create_llm(use_mock: bool, batch_size: int):
+    """
+    Create the LLM client, falling back to MockLLMClient without vLLM.
+
+    Only one client is kept, so a vLLM engine is never loaded twice on GPU 0.
+    """
+    from classifier import MockLLMClient
+
+    # Repeated --interactive texts reuse their mock responses
+    if use_mock:
+        return MockLLMClient(cache_size=1024)
+    try:
+        from classifier.infrastructure.llm import VLLMClientFactory
+
+        # Stages already send one batch_generate() call each; batch_size
+        # sets how many of those prompts go to the engine at once
+        return VLLMClientFactory.create(gpu_list=[0], batch_size=batch_size)
+    except ImportError:
+        return MockLLMClient(cache_size=1024)
+
+
+def _build_pipeline(
+    taxonomy_path: str,
+    artifacts_dir: str,
+    stages: int,
+    use_mock: bool,
+    batch_size: int,
+    verbose: bool,
+):
+    """
+    Run steps 1-4 (artifacts, content, schemas, pipeline) and return the pipeline.
+
+    The last pipeline is cached on (taxonomy, artifacts, use_mock, batch_size),
+    so repeated run_quick_test() calls in one process (e.g. from a notebook)
+    skip content loading and LLM start-up. `stages` and `verbose` are applied
+    to the cached pipeline. Use clear_pipeline_cache() to pick up edited
+    artifacts.
+    """
+    global _cached_pipeline
+
+    log = print if verbose else _silent
+    key = (taxonomy_path, artifacts_dir, use_mock, batch_size)
+
+    if _cached_pipeline is not None and _cached_pipeline[0] == key:
+        _, pipeline, schema_factory = _cached_pipeline
+        log("[1-4/6] Reusing pipeline from an earlier run in this process")
+        pipeline.verbose = verbose
+        if stages >= 3:
+            # Memoized by the factory - only builds what an earlier run skipped
+            max_workers = min(8, len(schema_factory.content.get_all_category_names()))
+            schema_factory.get_all_stage3_schemas(max_workers=max_workers)
+        return pipeline
+
+    # Release the previous pipeline (and its LLM client) before building another
+    clear_pipeline_cache()
 
     # =========================================================================
     # Step 1: Scaffold artifacts if needed
     # =========================================================================
-    print("[1/6] Scaffolding artifacts...")
+    log("[1/6] Scaffolding artifacts...")
 
     artifacts_path = Path(artifacts_dir)
     if not artifacts_path.exists():
@@ -80,19 +156,28 @@ def run_quick_test(
             print(f"ERROR: Schema file not found: {taxonomy_path}")
             sys.exit(1)
 
+        from classifier import scaffold_artifacts
+
         scaffold_artifacts(taxonomy_path, str(artifacts_path))
-        print(f"  ✓ Created artifacts at {artifacts_path}")
+        log(f"  ✓ Created artifacts at {artifacts_path}")
     else:
-        print(f"  ✓ Using existing artifacts at {artifacts_path}")
+        log(f"  ✓ Using existing artifacts at {artifacts_path}")
 
     # =========================================================================
     # Step 2: Load content (Handcrafted + YAML)
     # =========================================================================
-    print("[2/6] Loading content (Handcrafted + YAML)...")
+    log("[2/6] Loading content (Handcrafted + YAML)...")
+
+    # Classifier components are imported by the step that first needs them
+    from classifier import HandcraftedContentProvider, YAMLContentProvider
+    from classifier.content import CompositeContentProvider
 
     try:
         # Load both content sources
-        yaml_content = YAMLContentProvider(str(artifacts_path), verbose=False)
+        # Category folders are scanned in parallel - the YAML reads are independent
+        yaml_content = YAMLContentProvider(
+            str(artifacts_path), verbose=False, max_workers=os.cpu_count()
+        )
         handcrafted_content = HandcraftedContentProvider()
 
         # Combine: Handcrafted has priority, YAML fills gaps
@@ -104,17 +189,18 @@ def run_quick_test(
         )
 
         categories = content.get_all_category_names()
-        print(f"  ✓ Loaded {len(categories)} categories:")
-        for cat in categories[:5]:  # Show first 5
-            elements = content.get_all_element_names(cat)
-            print(f"      - {cat}: {len(elements)} elements")
-        if len(categories) > 5:
-            print(f"      ... and {len(categories) - 5} more")
-
-        # Show merged example counts
-        s1_examples = content.get_examples("stage1")
-        s2_examples = content.get_examples("stage2")
-        print(f"  ✓ Examples: {len(s1_examples)} Stage 1, {len(s2_examples)} Stage 2")
+        if verbose:
+            print(f"  ✓ Loaded {len(categories)} categories:")
+            for cat in categories[:5]:  # Show first 5
+                elements = content.get_all_element_names(cat)
+                print(f"      - {cat}: {len(elements)} elements")
+            if len(categories) > 5:
+                print(f"      ... and {len(categories) - 5} more")
+
+            # Show merged example counts
+            s1_examples = content.get_examples("stage1")
+            s2_examples = content.get_examples("stage2")
+            print(f"  ✓ Examples: {len(s1_examples)} Stage 1, {len(s2_examples)} Stage 2")
 
     except Exception as e:
         print(f"  ✗ Failed to load content: {e}")
@@ -124,36 +210,39 @@ def run_quick_test(
     # =========================================================================
     # Step 3: Build schemas
     # =========================================================================
-    print("[3/6] Building schemas...")
+    log("[3/6] Building schemas...")
 
+    from classifier import TaxonomySchemaFactory
+
+    # Schemas are memoized on their taxonomy names, so repeated runs in the
+    # same process (e.g. from a notebook) reuse the already-built models
     schema_factory = TaxonomySchemaFactory(content)
     stage1_schema = schema_factory.get_stage1_schema()
-    stage2_schemas = schema_factory.get_all_stage2_schemas()
+    # Per-category schemas are independent - build them on a small thread pool
+    max_workers = min(8, len(categories))
+    stage2_schemas = schema_factory.get_all_stage2_schemas(max_workers=max_workers)
 
-    print("  ✓ Stage 1 schema ready")
-    print(f"  ✓ Stage 2 schemas: {len(stage2_schemas)} categories")
+    log("  ✓ Stage 1 schema ready")
+    log(f"  ✓ Stage 2 schemas: {len(stage2_schemas)} categories")
 
     if stages >= 3:
-        stage3_schemas = schema_factory.get_all_stage3_schemas()
-        print(f"  ✓ Stage 3 schemas: {len(stage3_schemas)} pairs")
+        stage3_schemas = schema_factory.get_all_stage3_schemas(max_workers=max_workers)
+        log(f"  ✓ Stage 3 schemas: {len(stage3_schemas)} pairs")
 
     # =========================================================================
     # Step 4: Build pipeline
     # =========================================================================
-    print("[4/6] Building pipeline...")
+    log("[4/6] Building pipeline...")
 
-    if use_mock:
-        llm = MockLLMClient()
-        print("  ✓ Using MockLLMClient")
-    else:
-        try:
-            from classifier.infrastructure.llm import VLLMClientFactory
+    from classifier import MockLLMClient, PipelineBuilder
 
-            llm = VLLMClientFactory.create(gpu_list=[0])
-            print("  ✓ Using VLLMClient")
-        except ImportError:
-            llm = MockLLMClient()
-            print("  ⚠ VLLMClient not available, using MockLLMClient")
+    llm = _create_llm(use_mock, batch_size)
+    if not isinstance(llm, MockLLMClient):
+        log("  ✓ Using VLLMClient")
+    elif use_mock:
+        log("  ✓ Using MockLLMClient")
+    else:
+        print("  ⚠ VLLMClient not available, using MockLLMClient")
 
     pipeline = (
         PipelineBuilder()
@@ -163,24 +252,103 @@ def run_quick_test(
         .verbose(verbose)
         .build()
     )
-    print("  ✓ Pipeline ready")
+    log("  ✓ Pipeline ready")
+
+    _cached_pipeline = (key, pipeline, schema_factory)
+    return pipeline
+
+
+def _print_results(final_results, as_json: bool = False) -> None:
+    """
+    Print the category/element/attribute tree for each classified text.
+
+    The output is built in memory and written with a single stdout write.
+    With as_json=True the tree is printed as indented JSON instead.
+    """
+    if as_json:
+        tree = [
+            {
+                "text": text,
+                "categories": [
+                    cat.model_dump(mode="json") for cat in getattr(result, "categories", [])
+                ],
+            }
+            for text, result in final_results.items()
+        ]
+        if orjson is not None:
+            sys.stdout.write(orjson.dumps(tree, option=orjson.OPT_INDENT_2).decode() + "\n")
+        else:
+            sys.stdout.write(json.dumps(tree, indent=2, ensure_ascii=False) + "\n")
+        return
+
+    lines = []
+    for text, result in final_results.items():
+        lines.append(f"\n📝 {text[:60]}...")
+        if hasattr(result, "categories"):
+            for cat in result.categories:
+                lines.append(f"  📁 {cat.name}")
+                if hasattr(cat, "elements"):
+                    for elem in cat.elements:
+                        sentiment = _sentiment_value(elem.sentiment)
+                        lines.append(f"      → {elem.name} ({sentiment})")
+                        if hasattr(elem, "attributes") and elem.attributes:
+                            for attr in elem.attributes:
+                                attr_sentiment = _sentiment_value(attr.sentiment)
+                                lines.append(f"          • {attr.name} ({attr_sentiment})")
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def run_quick_test(
+    taxonomy_path: str = None,
+    artifacts_dir: str = None,
+    input_file: str = None,
+    comment_column: str = DEFAULT_COLUMN,
+    max_comments: int = 5,
+    stages: int = 2,
+    use_mock: bool = True,
+    batch_size: int = 25,
+    as_json: bool = False,
+    verbose: bool = True,
+):
+    """
+    Run a quick test of the pipeline.
+
+    Returns:
+        (final_results, flat_records) - merged results per text and
+        ResultMerger.to_flat_records() rows
+    """
+
+    # Use defaults if not provided
+    taxonomy_path = taxonomy_path or DEFAULT_SCHEMA
+    artifacts_dir = artifacts_dir or DEFAULT_ARTIFACTS
+
+    print("=" * 60)
+    print("QUICK TEST - Classifier Pipeline")
+    print("=" * 60)
+    print(f"Schema: {taxonomy_path}")
+    print(f"Artifacts: {artifacts_dir}")
+    print(f"Stages: {stages}")
+    print(f"Mock LLM: {use_mock}")
+    print()
+
+    log = print if verbose else _silent
+
+    pipeline = _build_pipeline(taxonomy_path, artifacts_dir, stages, use_mock, batch_size, verbose)
 
     # =========================================================================
     # Step 5: Run classification
     # =========================================================================
-    print("[5/6] Running classification...")
+    log("[5/6] Running classification...")
 
     # Get test texts
     if input_file and Path(input_file).exists():
-        import pandas as pd
-
-        df = pd.read_excel(input_file)
-        if comment_column in df.columns:
-            comments = df[comment_column].dropna().astype(str).tolist()[:max_comments]
-            print(f"  Loaded {len(comments)} comments from {input_file}")
+        comments = _load_comments(input_file, comment_column, max_comments)
+        if comments is not None:
+            log(f"  Loaded {len(comments)} comments from {input_file}")
         else:
             print(f"  ⚠ Column '{comment_column}' not found, using sample texts")
-            comments = None
     else:
         comments = None
 
@@ -193,61 +361,43 @@ def run_quick_test(
             "The workshop materials were outdated, and the presenter seemed unprepared.",
             "Overall, this was the best conference I've attended in years. Totally worth the price.",
         ][:max_comments]
-        print(f"  Using {len(comments)} sample texts")
+        log(f"  Using {len(comments)} sample texts")
 
     # Determine stages to run
-    stage_names = ["category_detection"]
-    if stages >= 2:
-        stage_names.append("element_extraction")
-    if stages >= 3:
-        stage_names.append("attribute_extraction")
+    stage_names = list(STAGE_NAMES[:stages])
 
-    print(f"  Running: {' → '.join(stage_names)}")
+    log(f"  Running: {' → '.join(stage_names)}")
 
+    # All comments go through in one call - each stage sends its prompts to
+    # the LLM as a single batch_generate() call, which vLLM batches on the GPU
     context = pipeline.run_with_context(comments, stages=stage_names)
-    print("  ✓ Classification complete")
+    log("  ✓ Classification complete")
 
     # =========================================================================
     # Step 6: Merge and display results
     # =========================================================================
-    print("[6/6] Merging results...")
+    log("[6/6] Merging results...")
+
+    from classifier import ResultMerger
 
     merger = ResultMerger()
     final_results = merger.merge(context)
     flat_records = merger.to_flat_records(final_results)
+    num_records = len(flat_records)
 
-    print(f"  ✓ Merged {len(final_results)} results")
-    print(f"  ✓ Created {len(flat_records)} flat records")
+    log(f"  ✓ Merged {len(final_results)} results")
+    log(f"  ✓ Created {num_records} flat records")
 
     # =========================================================================
-    # Display results
+    # Display results (skipped with --quiet; the summary below still prints)
     # =========================================================================
-    print()
-    print("=" * 60)
-    print("RESULTS")
-    print("=" * 60)
+    if verbose:
+        print()
+        print("=" * 60)
+        print("RESULTS")
+        print("=" * 60)
 
-    for text, result in final_results.items():
-        print(f"\n📝 {text[:60]}...")
-        if hasattr(result, "categories"):
-            for cat in result.categories:
-                print(f"  📁 {cat.name}")
-                if hasattr(cat, "elements"):
-                    for elem in cat.elements:
-                        sentiment = (
-                            elem.sentiment.value
-                            if hasattr(elem.sentiment, "value")
-                            else elem.sentiment
-                        )
-                        print(f"      → {elem.name} ({sentiment})")
-                        if hasattr(elem, "attributes") and elem.attributes:
-                            for attr in elem.attributes:
-                                attr_sentiment = (
-                                    attr.sentiment.value
-                                    if hasattr(attr.sentiment, "value")
-                                    else attr.sentiment
-                                )
-                                print(f"          • {attr.name} ({attr_sentiment})")
+        _print_results(final_results, as_json=as_json)
 
     # =========================================================================
     # Summary statistics
@@ -257,29 +407,29 @@ def run_quick_test(
     print("SUMMARY")
     print("=" * 60)
 
-    # Count categories
-    cat_counts = {}
-    sentiment_counts = {}
-    for record in flat_records:
-        cat = record.get("category")
-        if cat:
-            cat_counts[cat] = cat_counts.get(cat, 0) + 1
-
-        sentiment = record.get("element_sentiment") or record.get("attribute_sentiment")
+    # Count categories and sentiments in one pass over the flat records
+    # (empty values are skipped)
+    cat_counts = Counter()
+    sentiment_counts = Counter()
+    for rec in flat_records:
+        category = rec.get("category")
+        if category:
+            cat_counts[category] += 1
+        sentiment = rec.get("element_sentiment") or rec.get("attribute_sentiment")
         if sentiment:
-            sentiment_counts[sentiment] = sentiment_counts.get(sentiment, 0) + 1
+            sentiment_counts[sentiment] += 1
 
     print(f"Total texts: {len(final_results)}")
-    print(f"Total classifications: {len(flat_records)}")
+    print(f"Total classifications: {num_records}")
 
     if cat_counts:
         print("\nCategories:")
-        for cat, count in sorted(cat_counts.items(), key=lambda x: -x[1]):
+        for cat, count in cat_counts.most_common():
             print(f"  {cat}: {count}")
 
     if sentiment_counts:
         print("\nSentiments:")
-        for sentiment, count in sorted(sentiment_counts.items(), key=lambda x: -x[1]):
+        for sentiment, count in sentiment_counts.most_common():
             print(f"  {sentiment}: {count}")
 
     print()
@@ -290,6 +440,41 @@ def run_quick_test(
     return final_results, flat_records
 
 
+def run_interactive(
+    taxonomy_path: str = None,
+    artifacts_dir: str = None,
+    stages: int = 2,
+    use_mock: bool = True,
+    batch_size: int = 25,
+    as_json: bool = False,
+    verbose: bool = True,
+):
+    """Build the pipeline once, then classify texts typed at the prompt."""
+    taxonomy_path = taxonomy_path or DEFAULT_SCHEMA
+    artifacts_dir = artifacts_dir or DEFAULT_ARTIFACTS
+
+    pipeline = _build_pipeline(taxonomy_path, artifacts_dir, stages, use_mock, batch_size, verbose)
+    stage_names = list(STAGE_NAMES[:stages])
+
+    from classifier import ResultMerger
+
+    merger = ResultMerger()
+
+    print()
+    print("Enter a text to classify (empty line or Ctrl-D to quit)")
+    while True:
+        try:
+            text = input("> ").strip()
+        except EOFError:
+            break
+        if not text:
+            break
+
+        context = pipeline.run_with_context([text], stages=stage_names)
+        _print_results(merger.merge(context), as_json=as_json)
+        print()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Quick test script for classifier pipeline")
 
@@ -338,15 +523,43 @@ def main():
         action="store_true",
         help="Use real LLM instead of MockLLMClient",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=25,
+        help="Prompts per vLLM batch with --real-llm (default: 25)",
+    )
+    parser.add_argument(
+        "--interactive",
+        action="store_true",
+        help="Build the pipeline once, then classify texts typed at a prompt",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the result tree as JSON instead of the emoji outline",
+    )
     parser.add_argument(
         "--quiet",
         "-q",
         action="store_true",
-        help="Suppress verbose pipeline output",
+        help="Suppress progress output and the per-text results (summary still prints)",
     )
 
     args = parser.parse_args()
 
+    if args.interactive:
+        run_interactive(
+            taxonomy_path=args.taxonomy,
+            artifacts_dir=args.artifacts,
+            stages=args.stages,
+            use_mock=not args.real_llm,
+            batch_size=args.batch_size,
+            as_json=args.json,
+            verbose=not args.quiet,
+        )
+        return
+
     run_quick_test(
         taxonomy_path=args.taxonomy,
         artifacts_dir=args.artifacts,
@@ -355,6 +568,8 @@ def main():
         max_comments=args.max_comments,
         stages=args.stages,
         use_mock=not args.real_llm,
+        batch_size=args.batch_size,
+        as_json=args.json,
         verbose=not args.quiet,
     )
 